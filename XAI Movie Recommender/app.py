@@ -12,15 +12,212 @@ Prerequisites:
     - FastAPI backend running at http://127.0.0.1:8000
 """
 
+import functools
+import html
+import re
+import threading
 import streamlit as st
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future
+from itertools import islice
+from typing import List, Optional
 
 
 # Configuration
 API_BASE_URL = "http://127.0.0.1:8000"
 
+# Fail fast when the backend is down; only the read timeout needs to cover slow queries
+CONNECT_TIMEOUT = 3.05
+
+# User-facing messages for common request failures, checked in order.
+# Timeout comes first because ConnectTimeout is also a ConnectionError.
+REQUEST_ERROR_MESSAGES = (
+    (requests.exceptions.Timeout, "Request timed out. The API might be processing a large request."),
+    (requests.exceptions.ConnectionError, "Could not connect to the API. Make sure the backend is running."),
+)
+
+
+class APIError(Exception):
+    """Raised when the API answers with a non-200 status; the message is user-facing."""
+
+
+# Custom CSS, built once at import time and re-emitted on each rerun
+CUSTOM_CSS = """
+<style>
+.main-header {
+    font-size: 3rem;
+    color: #FF4B4B;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+.subtitle {
+    text-align: center;
+    color: #666;
+    margin-bottom: 3rem;
+}
+.recommendation-card {
+    background-color: #f0f2f6;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin-bottom: 1rem;
+    border-left: 5px solid #FF4B4B;
+}
+.source-movie {
+    background-color: #e8f4f8;
+    padding: 1rem;
+    border-radius: 10px;
+    margin-bottom: 2rem;
+    text-align: center;
+}
+</style>
+"""
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for all backend API calls.
+
+    Cached with st.cache_resource so a single keep-alive connection pool
+    survives Streamlit reruns instead of being rebuilt on every interaction.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTP adapter
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False  # Hand the final response back so callers can report its status
+        )
+    ))
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+@st.cache_resource
+def get_etag_store() -> dict:
+    """
+    Get the shared store of ETags and response bodies for conditional GETs.
+
+    Returns:
+        dict: API path -> (etag, decoded JSON body)
+    """
+    return {}
+
+
+def conditional_get_json(path: str, timeout) -> dict:
+    """
+    GET a JSON resource, revalidating any stored copy with If-None-Match.
+
+    When the backend answers 304 Not Modified the stored body is reused, so
+    an unchanged resource costs a header-only response.
+
+    Args:
+        path: API path (e.g. "/health")
+        timeout: requests timeout (connect, read)
+
+    Returns:
+        dict: Decoded JSON body
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or returns an error status
+    """
+    store = get_etag_store()
+    cached = store.get(path)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = get_http_session().get(f"{API_BASE_URL}{path}", headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    response.raise_for_status()
+    data = response.json()
+    if response.headers.get("ETag"):
+        store[path] = (response.headers["ETag"], data)
+    return data
+
+
+@st.cache_resource
+def get_inflight_registry():
+    """
+    Get the shared registry of in-flight backend calls.
+
+    Held in cache_resource because Streamlit re-executes this module on every
+    rerun, which would reset a plain module-level dict.
+
+    Returns:
+        tuple: (dict of call key -> Future, lock guarding the dict)
+    """
+    return {}, threading.Lock()
+
+
+def singleflight(func):
+    """
+    Collapse concurrent identical calls to func into a single backend request.
+
+    The first caller for a given argument key runs func; callers arriving
+    while it is in flight block on its Future and receive the same result.
+    st.cache_data alone does not do this: concurrent cache misses from
+    different sessions each execute the function body.
+
+    Args:
+        func: Function whose calls should be deduplicated
+
+    Returns:
+        Callable: Wrapped function
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        inflight, lock = get_inflight_registry()
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+        with lock:
+            future = inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = inflight[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with lock:
+                inflight.pop(key, None)
+
+    return wrapper
+
+
+def format_request_error(error: requests.exceptions.RequestException) -> str:
+    """
+    Turn a failed API request into a user-facing error message.
+
+    Args:
+        error: The exception raised by requests
+
+    Returns:
+        str: Error message for display
+    """
+    for error_type, message in REQUEST_ERROR_MESSAGES:
+        if isinstance(error, error_type):
+            return message
+    return f"Request failed: {str(error)}"
+
 
+@st.cache_data(ttl=10, show_spinner=False)
 def check_api_health() -> bool:
     """
     Check if the FastAPI backend is running and healthy.
@@ -29,131 +226,375 @@ def check_api_health() -> bool:
         bool: True if API is healthy, False otherwise
     """
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('status') == 'healthy'
-        return False
+        data = conditional_get_json("/health", timeout=(CONNECT_TIMEOUT, 5))
+        return data.get('status') == 'healthy'
     except requests.exceptions.RequestException:
         return False
 
 
-def get_recommendations(user_id: int, n: int = 5) -> Optional[dict]:
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+@singleflight
+def fetch_recommend_or_fallback(user_id: int, n: int = 5, fallback_limit: int = 10) -> dict:
     """
-    Fetch movie recommendations from the API.
+    Fetch movie recommendations, or the user's rating history if none are available.
+
+    Both outcomes come back from a single API round-trip; the 'mode' field of
+    the response says whether 'recommendations' or 'rated_movies' is populated.
+    Failures raise instead of returning a value so that they are never cached.
 
     Args:
         user_id: The user ID to get recommendations for
         n: Number of recommendations to fetch
+        fallback_limit: Number of rated movies to fetch in fallback mode
 
     Returns:
-        dict: API response data or None if request fails
-    """
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/recommend/{user_id}",
-            params={"n": n},
-            timeout=30
-        )
+        dict: API response data
 
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            return {'error': f"User {user_id} not found"}
-        else:
-            return {'error': f"API returned status code {response.status_code}"}
+    Raises:
+        APIError: If the API answers with a non-200 status
+        requests.exceptions.RequestException: If the request fails
+    """
+    response = get_http_session().get(
+        f"{API_BASE_URL}/user/{user_id}/recommend-or-fallback",
+        params={"n": n, "fallback_limit": fallback_limit},
+        timeout=(CONNECT_TIMEOUT, 30)
+    )
 
-    except requests.exceptions.Timeout:
-        return {'error': "Request timed out. The API might be processing a large request."}
-    except requests.exceptions.ConnectionError:
-        return {'error': "Could not connect to the API. Make sure the backend is running."}
-    except requests.exceptions.RequestException as e:
-        return {'error': f"Request failed: {str(e)}"}
+    if response.status_code == 404:
+        raise APIError(f"User {user_id} not found")
+    if response.status_code != 200:
+        raise APIError(f"API returned status code {response.status_code}")
+    return response.json()
 
 
-def get_user_rated_movies(user_id: int, limit: int = 5) -> Optional[dict]:
+def get_recommend_or_fallback(user_id: int, n: int = 5, fallback_limit: int = 10) -> dict:
     """
-    Fetch movies rated by a user from the API.
+    Get recommendations or the rating history fallback, turning failures into an error entry.
 
     Args:
-        user_id: The user ID
-        limit: Maximum number of movies to fetch
+        user_id: The user ID to get recommendations for
+        n: Number of recommendations to fetch
+        fallback_limit: Number of rated movies to fetch in fallback mode
 
     Returns:
-        dict: API response data or None if request fails
+        dict: API response data, or {'error': message} if the request failed
     """
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/user/{user_id}/rated",
-            params={"limit": limit},
-            timeout=10
-        )
+        return fetch_recommend_or_fallback(user_id, n=n, fallback_limit=fallback_limit)
+    except APIError as e:
+        return {'error': str(e)}
+    except requests.exceptions.RequestException as e:
+        return {'error': format_request_error(e)}
 
-        if response.status_code == 200:
-            return response.json()
-        return None
 
-    except requests.exceptions.RequestException:
-        return None
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_all_titles() -> List[str]:
+    """
+    Fetch the full, alphabetically sorted list of movie titles from the API.
+
+    Cached for an hour so movie search runs locally instead of making a
+    backend call per query. Failures raise instead of returning a value so
+    that they are never cached.
+
+    Returns:
+        list: All movie titles
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    return conditional_get_json("/movies/titles", timeout=(CONNECT_TIMEOUT, 30))['titles']
 
 
-def search_movies(query: str, limit: int = 10) -> Optional[dict]:
+def search_movies(query: str, limit: int = 10) -> Optional[List[str]]:
     """
-    Search for movies by title from the API.
+    Search for movies by title in the locally cached title list.
 
     Args:
-        query: Search query (partial movie title)
-        limit: Maximum number of results to fetch
+        query: Search query (partial movie title, case-insensitive)
+        limit: Maximum number of results to return
 
     Returns:
-        dict: API response data or None if request fails
+        list: Matching titles in alphabetical order, or None if titles couldn't be loaded
     """
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/movies/search",
-            params={"q": query, "limit": limit},
-            timeout=10
-        )
-
-        if response.status_code == 200:
-            return response.json()
-        return None
-
+        titles = get_all_titles()
     except requests.exceptions.RequestException:
         return None
 
+    query = query.lower()
+    return list(islice((title for title in titles if query in title.lower()), limit))
+
 
-def get_recommendations_by_movie(movie_title: str, n: int = 5) -> Optional[dict]:
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+@singleflight
+def fetch_recommendations_by_movie(movie_title: str, n: int = 5) -> dict:
     """
     Fetch movie recommendations based on a movie title from the API.
 
+    Failures raise instead of returning a value so that they are never cached.
+
+    Args:
+        movie_title: The movie title to base recommendations on
+        n: Number of recommendations to fetch
+
+    Returns:
+        dict: API response data
+
+    Raises:
+        APIError: If the API answers with a non-200 status
+        requests.exceptions.RequestException: If the request fails
+    """
+    response = get_http_session().get(
+        f"{API_BASE_URL}/recommend/by-movie/{movie_title}",
+        params={"n": n},
+        timeout=(CONNECT_TIMEOUT, 30)
+    )
+
+    if response.status_code == 404:
+        raise APIError(f"Movie '{movie_title}' not found")
+    if response.status_code != 200:
+        raise APIError(f"API returned status code {response.status_code}")
+    return response.json()
+
+
+def get_recommendations_by_movie(movie_title: str, n: int = 5) -> dict:
+    """
+    Get recommendations for a movie title, turning failures into an error entry.
+
     Args:
         movie_title: The movie title to base recommendations on
         n: Number of recommendations to fetch
 
     Returns:
-        dict: API response data or None if request fails
+        dict: API response data, or {'error': message} if the request failed
     """
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/recommend/by-movie/{movie_title}",
-            params={"n": n},
-            timeout=30
+        return fetch_recommendations_by_movie(movie_title, n=n)
+    except APIError as e:
+        return {'error': str(e)}
+    except requests.exceptions.RequestException as e:
+        return {'error': format_request_error(e)}
+
+
+def render_recommendation_cards(recommendations: list, source_description: str) -> str:
+    """
+    Render all recommendations as one block of HTML cards.
+
+    Emitting a single markdown element instead of a container, columns and an
+    expander per recommendation keeps the number of Streamlit widgets (and
+    delta messages) constant regardless of how many movies are shown.
+
+    Args:
+        recommendations: Recommendation dicts from the API
+        source_description: What the similarity score is measured against
+            (e.g. "your favorite movie")
+
+    Returns:
+        str: HTML for st.markdown(..., unsafe_allow_html=True)
+    """
+    cards = []
+    for i, rec in enumerate(recommendations, 1):
+        # Explanations use **bold** markdown, which isn't rendered inside HTML blocks
+        explanation = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", html.escape(rec['explanation']))
+        cards.append(
+            f'''<div class="recommendation-card">
+<h3>{i}. {html.escape(rec['movie_title'])}</h3>
+<p>💡 {explanation}</p>
+<details>
+<summary>📊 Technical Details</summary>
+<p><b>Similarity Score:</b> {rec['similarity']:.4f}<br><b>Movie ID:</b> {rec['movie_id']}</p>
+<small>The similarity score represents how close this movie is to {source_description}
+in the knowledge graph embedding space.</small>
+</details>
+</div>'''
         )
+    return "\n".join(cards)
 
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            return {'error': f"Movie '{movie_title}' not found"}
-        else:
-            return {'error': f"API returned status code {response.status_code}"}
 
-    except requests.exceptions.Timeout:
-        return {'error': "Request timed out. The API might be processing a large request."}
-    except requests.exceptions.ConnectionError:
-        return {'error': "Could not connect to the API. Make sure the backend is running."}
-    except requests.exceptions.RequestException as e:
-        return {'error': f"Request failed: {str(e)}"}
+@st.fragment
+def user_mode_tab(num_recommendations: int):
+    """
+    Render the User Mode tab.
+
+    Runs as a fragment so widget interactions inside the tab rerun only this
+    tab rather than the whole script.
+
+    Args:
+        num_recommendations: Number of recommendations to request
+    """
+    st.markdown("### Get recommendations based on your rating history")
+    st.caption("Enter your User ID to get personalized recommendations")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col2:
+        # User input
+        user_id_input = st.text_input(
+            "Enter your User ID",
+            value="1",
+            help="Enter a MovieLens user ID (typically a number between 1 and 610)",
+            key="user_id_input"
+        )
+
+        # Get recommendations button
+        if st.button("🎯 Get Recommendations", type="primary", use_container_width=True, key="user_recommend_btn"):
+            # Validate input
+            if not user_id_input.strip():
+                st.error("Please enter a User ID")
+            else:
+                try:
+                    user_id = int(user_id_input)
+                except ValueError:
+                    st.error("User ID must be a number")
+                    user_id = None
+
+                if user_id and user_id < 1:
+                    st.error("User ID must be a positive number")
+                    user_id = None
+
+                if user_id:
+                    # Show loading spinner
+                    with st.spinner("🔍 Analyzing your movie preferences..."):
+                        # Fetch recommendations (or the rating history fallback) in one call
+                        result = get_recommend_or_fallback(user_id, n=num_recommendations, fallback_limit=10)
+
+                    # Check for errors
+                    if result is None:
+                        st.error("Failed to fetch recommendations")
+                    elif 'error' in result:
+                        st.error(f"Error: {result['error']}")
+                    elif result.get('mode') == 'rated_movies':
+                        st.warning(result['message'])
+
+                        # Show what movies the user has rated
+                        st.info("Let's see what movies you've rated:")
+
+                        if result.get('rated_movies'):
+                            for movie in result['rated_movies']:
+                                st.write(f"⭐ **{movie['title']}** - Rating: {movie['rating']}/5.0")
+                        else:
+                            st.write("No rating history found for this user.")
+                    else:
+                        # Show source movie
+                        if result.get('source_movie'):
+                            st.markdown(
+                                f"""
+                                <div class="source-movie">
+                                    <h3>📽️ Based on your love for:</h3>
+                                    <h2>{result['source_movie']}</h2>
+                                </div>
+                                """,
+                                unsafe_allow_html=True
+                            )
+
+                        # Show recommendations
+                        if result.get('recommendations'):
+                            st.markdown("### 🎯 Recommended Movies for You:")
+
+                            st.markdown(
+                                render_recommendation_cards(result['recommendations'], "your favorite movie"),
+                                unsafe_allow_html=True
+                            )
+                        else:
+                            st.info("No recommendations found. Try a different user ID.")
+
+
+@st.fragment
+def guest_mode_tab(num_recommendations: int):
+    """
+    Render the Guest Mode tab.
+
+    Runs as a fragment so searching and selecting a movie rerun only this
+    tab rather than the whole script.
+
+    Args:
+        num_recommendations: Number of recommendations to request
+    """
+    st.markdown("### Get recommendations based on a movie you like")
+    st.caption("No account needed! Just enter a movie title to discover similar movies")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col2:
+        # Movie search input - wrapped in a form so the backend is only
+        # queried when the user submits, not on every edit/blur rerun
+        with st.form("movie_search_form"):
+            movie_query_input = st.text_input(
+                "Search for a movie",
+                placeholder="e.g., Toy Story, The Matrix, Inception...",
+                help="Type a title and press Enter or click Search",
+                key="movie_search_input"
+            )
+            search_submitted = st.form_submit_button("🔍 Search", use_container_width=True)
+
+        # Keep the last submitted query so results survive later reruns
+        if search_submitted:
+            st.session_state['movie_query'] = movie_query_input.strip()
+        movie_query = st.session_state.get('movie_query', '')
+
+        # Show search results
+        if movie_query and len(movie_query) >= 2:
+            with st.spinner("🔍 Searching movies..."):
+                titles = search_movies(movie_query, limit=10)
+
+            if titles is None:
+                st.error("Could not load the movie list. Make sure the backend is running.")
+            elif titles:
+                st.markdown("**Found movies:**")
+
+                # Let user select from search results
+                selected_movie = st.selectbox(
+                    "Select a movie:",
+                    options=titles,
+                    index=None,
+                    placeholder="Choose a movie...",
+                    key="movie_select"
+                )
+
+                # Get recommendations button
+                if st.button("🎯 Get Similar Movies", type="primary", use_container_width=True, key="guest_recommend_btn"):
+                    if selected_movie:
+                        # Show loading spinner
+                        with st.spinner(f"🔍 Finding movies similar to {selected_movie}..."):
+                            # Fetch recommendations
+                            result = get_recommendations_by_movie(selected_movie, n=num_recommendations)
+
+                        # Check for errors
+                        if result is None:
+                            st.error("Failed to fetch recommendations")
+                        elif 'error' in result:
+                            st.error(f"Error: {result['error']}")
+                        elif result.get('message') and not result.get('recommendations'):
+                            st.warning(result['message'])
+                        else:
+                            # Show source movie
+                            if result.get('source_movie'):
+                                st.markdown(
+                                    f"""
+                                    <div class="source-movie">
+                                        <h3>📽️ Because you like:</h3>
+                                        <h2>{result['source_movie']}</h2>
+                                    </div>
+                                    """,
+                                    unsafe_allow_html=True
+                                )
+
+                            # Show recommendations
+                            if result.get('recommendations'):
+                                st.markdown("### 🎯 You Might Also Like:")
+
+                                st.markdown(
+                                    render_recommendation_cards(result['recommendations'], "the selected movie"),
+                                    unsafe_allow_html=True
+                                )
+                            else:
+                                st.info("No recommendations found. Try a different movie.")
+                    else:
+                        st.warning("Please select a movie first")
+            else:
+                st.info("No movies found. Try a different search term.")
+        elif movie_query:
+            st.info("Type at least 2 characters to search")
 
 
 def main():
@@ -169,35 +610,7 @@ def main():
     )
 
     # Custom CSS for better styling
-    st.markdown("""
-        <style>
-        .main-header {
-            font-size: 3rem;
-            color: #FF4B4B;
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 3rem;
-        }
-        .recommendation-card {
-            background-color: #f0f2f6;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin-bottom: 1rem;
-            border-left: 5px solid #FF4B4B;
-        }
-        .source-movie {
-            background-color: #e8f4f8;
-            padding: 1rem;
-            border-radius: 10px;
-            margin-bottom: 2rem;
-            text-align: center;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     # Header
     st.markdown('<h1 class="main-header">🎬 XAI Movie Recommender</h1>', unsafe_allow_html=True)
@@ -244,195 +657,11 @@ def main():
 
     # ===== TAB 1: USER MODE =====
     with tab1:
-        st.markdown("### Get recommendations based on your rating history")
-        st.caption("Enter your User ID to get personalized recommendations")
-
-        col1, col2, col3 = st.columns([1, 2, 1])
-
-        with col2:
-            # User input
-            user_id_input = st.text_input(
-                "Enter your User ID",
-                value="1",
-                help="Enter a MovieLens user ID (typically a number between 1 and 610)",
-                key="user_id_input"
-            )
-
-            # Get recommendations button
-            if st.button("🎯 Get Recommendations", type="primary", use_container_width=True, key="user_recommend_btn"):
-                # Validate input
-                if not user_id_input.strip():
-                    st.error("Please enter a User ID")
-                else:
-                    try:
-                        user_id = int(user_id_input)
-                    except ValueError:
-                        st.error("User ID must be a number")
-                        user_id = None
-
-                    if user_id and user_id < 1:
-                        st.error("User ID must be a positive number")
-                        user_id = None
-
-                    if user_id:
-                        # Show loading spinner
-                        with st.spinner("🔍 Analyzing your movie preferences..."):
-                            # Fetch recommendations
-                            result = get_recommendations(user_id, n=num_recommendations)
-
-                        # Check for errors
-                        if result is None:
-                            st.error("Failed to fetch recommendations")
-                        elif 'error' in result:
-                            st.error(f"Error: {result['error']}")
-                        elif result.get('message') and not result.get('recommendations'):
-                            st.warning(result['message'])
-
-                            # Show what movies the user has rated
-                            st.info("Let's see what movies you've rated:")
-                            rated_movies = get_user_rated_movies(user_id, limit=10)
-
-                            if rated_movies and rated_movies.get('rated_movies'):
-                                for movie in rated_movies['rated_movies']:
-                                    st.write(f"⭐ **{movie['title']}** - Rating: {movie['rating']}/5.0")
-                            else:
-                                st.write("No rating history found for this user.")
-                        else:
-                            # Show source movie
-                            if result.get('source_movie'):
-                                st.markdown(
-                                    f"""
-                                    <div class="source-movie">
-                                        <h3>📽️ Based on your love for:</h3>
-                                        <h2>{result['source_movie']}</h2>
-                                    </div>
-                                    """,
-                                    unsafe_allow_html=True
-                                )
-
-                            # Show recommendations
-                            if result.get('recommendations'):
-                                st.markdown("### 🎯 Recommended Movies for You:")
-
-                                for i, rec in enumerate(result['recommendations'], 1):
-                                    with st.container():
-                                        col_num, col_content = st.columns([0.5, 9.5])
-
-                                        with col_num:
-                                            st.markdown(f"### {i}")
-
-                                        with col_content:
-                                            st.markdown(f"### {rec['movie_title']}")
-
-                                            # Explanation
-                                            st.info(f"💡 {rec['explanation']}")
-
-                                            # Similarity score in an expander
-                                            with st.expander("📊 Technical Details"):
-                                                st.write(f"**Similarity Score:** {rec['similarity']:.4f}")
-                                                st.write(f"**Movie ID:** {rec['movie_id']}")
-                                                st.caption(
-                                                    "The similarity score represents how close this movie is "
-                                                    "to your favorite movie in the knowledge graph embedding space."
-                                                )
-
-                                        st.markdown("---")
-                            else:
-                                st.info("No recommendations found. Try a different user ID.")
+        user_mode_tab(num_recommendations)
 
     # ===== TAB 2: GUEST MODE =====
     with tab2:
-        st.markdown("### Get recommendations based on a movie you like")
-        st.caption("No account needed! Just enter a movie title to discover similar movies")
-
-        col1, col2, col3 = st.columns([1, 2, 1])
-
-        with col2:
-            # Movie search input
-            movie_query = st.text_input(
-                "Search for a movie",
-                placeholder="e.g., Toy Story, The Matrix, Inception...",
-                help="Start typing to search for movies in our database",
-                key="movie_search_input"
-            )
-
-            # Show search results
-            if movie_query and len(movie_query) >= 2:
-                with st.spinner("🔍 Searching movies..."):
-                    search_results = search_movies(movie_query, limit=10)
-
-                if search_results and search_results.get('results'):
-                    st.markdown("**Found movies:**")
-
-                    # Let user select from search results
-                    movie_options = {movie['title']: movie for movie in search_results['results']}
-                    selected_movie = st.selectbox(
-                        "Select a movie:",
-                        options=list(movie_options.keys()),
-                        key="movie_select"
-                    )
-
-                    # Get recommendations button
-                    if st.button("🎯 Get Similar Movies", type="primary", use_container_width=True, key="guest_recommend_btn"):
-                        if selected_movie:
-                            # Show loading spinner
-                            with st.spinner(f"🔍 Finding movies similar to {selected_movie}..."):
-                                # Fetch recommendations
-                                result = get_recommendations_by_movie(selected_movie, n=num_recommendations)
-
-                            # Check for errors
-                            if result is None:
-                                st.error("Failed to fetch recommendations")
-                            elif 'error' in result:
-                                st.error(f"Error: {result['error']}")
-                            elif result.get('message') and not result.get('recommendations'):
-                                st.warning(result['message'])
-                            else:
-                                # Show source movie
-                                if result.get('source_movie'):
-                                    st.markdown(
-                                        f"""
-                                        <div class="source-movie">
-                                            <h3>📽️ Because you like:</h3>
-                                            <h2>{result['source_movie']}</h2>
-                                        </div>
-                                        """,
-                                        unsafe_allow_html=True
-                                    )
-
-                                # Show recommendations
-                                if result.get('recommendations'):
-                                    st.markdown("### 🎯 You Might Also Like:")
-
-                                    for i, rec in enumerate(result['recommendations'], 1):
-                                        with st.container():
-                                            col_num, col_content = st.columns([0.5, 9.5])
-
-                                            with col_num:
-                                                st.markdown(f"### {i}")
-
-                                            with col_content:
-                                                st.markdown(f"### {rec['movie_title']}")
-
-                                                # Explanation
-                                                st.info(f"💡 {rec['explanation']}")
-
-                                                # Similarity score in an expander
-                                                with st.expander("📊 Technical Details"):
-                                                    st.write(f"**Similarity Score:** {rec['similarity']:.4f}")
-                                                    st.write(f"**Movie ID:** {rec['movie_id']}")
-                                                    st.caption(
-                                                        "The similarity score represents how close this movie is "
-                                                        "to the selected movie in the knowledge graph embedding space."
-                                                    )
-
-                                            st.markdown("---")
-                                else:
-                                    st.info("No recommendations found. Try a different movie.")
-                else:
-                    st.info("No movies found. Try a different search term.")
-            elif movie_query:
-                st.info("Type at least 2 characters to search")
+        guest_mode_tab(num_recommendations)
 
     # Footer
     st.markdown("---")
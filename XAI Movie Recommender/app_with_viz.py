@@ -16,18 +16,66 @@ Prerequisites:
     - Trained Node2Vec model
 """
 
+import functools
+import html
+import re
+import threading
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future
 from typing import Optional
-import plotly.graph_objects as go
-import plotly.express as px
-from visualize import GraphVisualizer
-import pandas as pd
 
 
 # Configuration
 API_BASE_URL = "http://127.0.0.1:8000"
 
+# Fail fast when the backend is down; only the read timeout needs to cover slow queries
+CONNECT_TIMEOUT = 3.05
+
+# User-facing messages for common request failures, checked in order.
+# Timeout comes first because ConnectTimeout is also a ConnectionError.
+REQUEST_ERROR_MESSAGES = (
+    (requests.exceptions.Timeout, "Request timed out"),
+    (requests.exceptions.ConnectionError, "Could not connect to the API"),
+)
+
+
+class APIError(Exception):
+    """Raised when the API answers with a non-200 status; the message is user-facing."""
+
+
+# Custom CSS, built once at import time and re-emitted on each rerun
+CUSTOM_CSS = """
+<style>
+.main-header {
+    font-size: 3rem;
+    color: #FF4B4B;
+    text-align: center;
+    margin-bottom: 1rem;
+}
+.subtitle {
+    text-align: center;
+    color: #666;
+    margin-bottom: 2rem;
+}
+.recommendation-card {
+    background-color: #f0f2f6;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin-bottom: 1rem;
+    border-left: 5px solid #FF4B4B;
+}
+.legend-box {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+</style>
+"""
+
 
 # Page config
 st.set_page_config(
@@ -38,9 +86,31 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Get cached HTTP session with a pooled, retrying adapter."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False  # Hand the final response back so callers can report its status
+        )
+    ))
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
 @st.cache_resource
 def get_visualizer():
     """Get cached visualizer instance."""
+    # Imported lazily: visualize pulls in plotly, sklearn, gensim and pandas,
+    # which plain recommendation lookups never need
+    from visualize import GraphVisualizer
+
     try:
         return GraphVisualizer()
     except Exception as e:
@@ -48,56 +118,130 @@ def get_visualizer():
         return None
 
 
+@st.cache_resource
+def get_etag_store() -> dict:
+    """Get cached store of path -> (etag, JSON body) for conditional GETs."""
+    return {}
+
+
+def conditional_get_json(path: str, timeout) -> dict:
+    """GET a JSON resource, reusing the stored body when the backend answers 304."""
+    store = get_etag_store()
+    cached = store.get(path)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = get_http_session().get(f"{API_BASE_URL}{path}", headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    response.raise_for_status()
+    data = response.json()
+    if response.headers.get("ETag"):
+        store[path] = (response.headers["ETag"], data)
+    return data
+
+
+@st.cache_resource
+def get_inflight_registry():
+    """Get cached registry of in-flight backend calls (survives script reruns)."""
+    return {}, threading.Lock()
+
+
+def singleflight(func):
+    """Collapse concurrent identical calls to func into one backend request."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        inflight, lock = get_inflight_registry()
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+        with lock:
+            future = inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = inflight[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with lock:
+                inflight.pop(key, None)
+
+    return wrapper
+
+
+def format_request_error(error: requests.exceptions.RequestException) -> str:
+    """Turn a failed API request into a user-facing error message."""
+    for error_type, message in REQUEST_ERROR_MESSAGES:
+        if isinstance(error, error_type):
+            return message
+    return f"Request failed: {str(error)}"
+
+
+@st.cache_data(ttl=10, show_spinner=False)
 def check_api_health() -> bool:
     """Check if the FastAPI backend is running and healthy."""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('status') == 'healthy'
-        return False
+        data = conditional_get_json("/health", timeout=(CONNECT_TIMEOUT, 5))
+        return data.get('status') == 'healthy'
     except requests.exceptions.RequestException:
         return False
 
 
-def get_recommendations(user_id: int, n: int = 5) -> Optional[dict]:
-    """Fetch movie recommendations from the API."""
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/recommend/{user_id}",
-            params={"n": n},
-            timeout=30
-        )
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+@singleflight
+def fetch_recommendations(user_id: int, n: int = 5) -> dict:
+    """Fetch movie recommendations from the API; failures raise so they are never cached."""
+    response = get_http_session().get(
+        f"{API_BASE_URL}/recommend/{user_id}",
+        params={"n": n},
+        timeout=(CONNECT_TIMEOUT, 30)
+    )
+
+    if response.status_code == 404:
+        raise APIError(f"User {user_id} not found")
+    if response.status_code != 200:
+        raise APIError(f"API returned status code {response.status_code}")
+    return response.json()
 
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            return {'error': f"User {user_id} not found"}
-        else:
-            return {'error': f"API returned status code {response.status_code}"}
 
-    except requests.exceptions.Timeout:
-        return {'error': "Request timed out"}
-    except requests.exceptions.ConnectionError:
-        return {'error': "Could not connect to the API"}
+def get_recommendations(user_id: int, n: int = 5) -> dict:
+    """Get movie recommendations, or {'error': message} if the request failed."""
+    try:
+        return fetch_recommendations(user_id, n=n)
+    except APIError as e:
+        return {'error': str(e)}
     except requests.exceptions.RequestException as e:
-        return {'error': f"Request failed: {str(e)}"}
+        return {'error': format_request_error(e)}
 
 
-def get_user_rated_movies(user_id: int, limit: int = 10) -> Optional[dict]:
-    """Fetch movies rated by a user from the API."""
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}/user/{user_id}/rated",
-            params={"limit": limit},
-            timeout=10
-        )
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+@singleflight
+def fetch_user_rated_movies(user_id: int, limit: int = 10) -> dict:
+    """Fetch movies rated by a user from the API; failures raise so they are never cached."""
+    response = get_http_session().get(
+        f"{API_BASE_URL}/user/{user_id}/rated",
+        params={"limit": limit},
+        timeout=(CONNECT_TIMEOUT, 10)
+    )
 
-        if response.status_code == 200:
-            return response.json()
-        return None
+    if response.status_code != 200:
+        raise APIError(f"API returned status code {response.status_code}")
+    return response.json()
 
-    except requests.exceptions.RequestException:
+
+def get_user_rated_movies(user_id: int, limit: int = 10) -> Optional[dict]:
+    """Get movies rated by a user, or None if the request failed."""
+    try:
+        return fetch_user_rated_movies(user_id, limit=limit)
+    except (APIError, requests.exceptions.RequestException):
         return None
 
 
@@ -105,27 +249,7 @@ def main():
     """Main Streamlit application."""
 
     # Custom CSS
-    st.markdown("""
-        <style>
-        .main-header {
-            font-size: 3rem;
-            color: #FF4B4B;
-            text-align: center;
-            margin-bottom: 1rem;
-        }
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 2rem;
-        }
-        .legend-box {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 5px;
-            margin: 1rem 0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     # Header
     st.markdown('<h1 class="main-header">🎬 XAI Movie Recommender</h1>', unsafe_allow_html=True)
@@ -198,6 +322,22 @@ def main():
     )
 
 
+def render_recommendation_card(rank: int, rec: dict) -> str:
+    """Render one recommendation as an HTML card (title, explanation, details)."""
+    # Explanations use **bold** markdown, which isn't rendered inside HTML blocks
+    explanation = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", html.escape(rec['explanation']))
+    return f'''<div class="recommendation-card">
+<h3>{rank}. {html.escape(rec['movie_title'])}</h3>
+<p>💡 {explanation}</p>
+<details>
+<summary>📊 Technical Details</summary>
+<p><b>Similarity Score:</b> {rec['similarity']:.4f}</p>
+<small>Higher scores indicate stronger similarity in the graph embedding space</small>
+</details>
+</div>'''
+
+
+@st.fragment
 def show_recommendation_mode(user_id_input, num_recommendations, show_visualizations):
     """Show recommendation interface."""
 
@@ -249,40 +389,48 @@ def show_recommendation_mode(user_id_input, num_recommendations, show_visualizat
             if result.get('recommendations'):
                 st.markdown("### 🎯 Your Personalized Recommendations")
 
+                # Fetch every recommendation path in one Neo4j round-trip
+                path_figures = {}
+                viz = get_visualizer() if show_visualizations else None
+                if viz:
+                    with st.spinner("Generating graphs..."):
+                        try:
+                            path_figures = viz.visualize_recommendation_paths_batch(
+                                result['source_movie'],
+                                [rec['movie_title'] for rec in result['recommendations']]
+                            )
+                        except Exception as e:
+                            st.caption(f"Visualization unavailable: {str(e)}")
+
+                if not viz:
+                    # No charts to lay out alongside, so emit every card as one element
+                    st.markdown(
+                        "\n".join(
+                            render_recommendation_card(i, rec)
+                            for i, rec in enumerate(result['recommendations'], 1)
+                        ),
+                        unsafe_allow_html=True
+                    )
+                    return
+
                 for i, rec in enumerate(result['recommendations'], 1):
-                    with st.container():
-                        st.markdown(f"### {i}. {rec['movie_title']}")
-
-                        col_left, col_right = st.columns([1, 1])
-
-                        with col_left:
-                            st.info(f"💡 {rec['explanation']}")
-
-                            with st.expander("📊 Technical Details"):
-                                st.metric("Similarity Score", f"{rec['similarity']:.4f}")
-                                st.caption("Higher scores indicate stronger similarity in the graph embedding space")
-
-                        with col_right:
-                            if show_visualizations:
-                                # Show path visualization
-                                viz = get_visualizer()
-                                if viz:
-                                    with st.spinner("Generating graph..."):
-                                        try:
-                                            fig = viz.visualize_recommendation_path(
-                                                result['source_movie'],
-                                                rec['movie_title']
-                                            )
-                                            if fig:
-                                                st.plotly_chart(fig, use_container_width=True)
-                                            else:
-                                                st.caption("No direct path visualization available")
-                                        except Exception as e:
-                                            st.caption(f"Visualization unavailable: {str(e)}")
-
-                        st.markdown("---")
+                    col_left, col_right = st.columns([1, 1])
+
+                    with col_left:
+                        st.markdown(render_recommendation_card(i, rec), unsafe_allow_html=True)
+
+                    with col_right:
+                        # Show path visualization
+                        fig = path_figures.get(rec['movie_title'])
+                        if fig:
+                            st.plotly_chart(fig, use_container_width=True)
+                        else:
+                            st.caption("No direct path visualization available")
+
+                    st.markdown("---")
 
 
+@st.fragment
 def show_graph_explorer_mode():
     """Show graph exploration interface."""
     st.header("🔍 Knowledge Graph Explorer")
@@ -335,11 +483,11 @@ def show_graph_explorer_mode():
             if viz:
                 with st.spinner("Building user's movie network..."):
                     try:
-                        G = viz.get_user_graph(user_id, limit=num_movies)
-                        st.info(f"Network has {G.number_of_nodes()} nodes and {G.number_of_edges()} connections")
+                        nodes, edges = viz.get_user_graph(user_id, limit=num_movies)
+                        st.info(f"Network has {len(nodes)} nodes and {len(edges)} connections")
 
                         # Display basic stats
-                        movie_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'Movie']
+                        movie_nodes = [n for n, d in nodes.items() if d.get('type') == 'Movie']
                         st.success(f"Found {len(movie_nodes)} movies with their connections to actors, directors, and genres")
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
@@ -347,6 +495,7 @@ def show_graph_explorer_mode():
                 st.error("Visualizer not available")
 
 
+@st.fragment
 def show_embeddings_mode():
     """Show embedding visualization interface."""
     st.header("📊 Node2Vec Embeddings Visualization")
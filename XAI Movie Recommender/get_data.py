@@ -15,19 +15,132 @@ Prerequisites:
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import os
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from dotenv import load_dotenv
 
 
-def get_movie_details(tmdb_id, api_key):
+# TMDb allows roughly 50 requests per second per IP; stay comfortably below it
+REQUESTS_PER_SECOND = 40
+MAX_WORKERS = 32
+CACHE_COMMIT_EVERY = 100
+
+# One keep-alive connection pool to api.themoviedb.org shared by all workers,
+# so each request skips the TCP and TLS handshake. Retry honours Retry-After
+# on 429 and backs off exponentially on transient server errors.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that spaces out request start times.
+
+    Args:
+        rate (float): Sustained number of requests allowed per second
+        burst (int): Number of requests allowed back-to-back after idling
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may start a request."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token even if it is not available yet; a negative
+            # balance is the queue of callers waiting ahead of this one
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def open_credits_cache(path):
+    """
+    Open (creating if needed) the SQLite cache of TMDb credits.
+
+    Args:
+        path (str): Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Open connection to the cache
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS credits (
+            tmdb_id INTEGER PRIMARY KEY,
+            director TEXT,
+            actors TEXT,
+            fetched_at INTEGER
+        )
+    """)
+    return conn
+
+
+def load_cached_credits(conn):
+    """
+    Load every cached credits entry.
+
+    Args:
+        conn (sqlite3.Connection): Open cache connection
+
+    Returns:
+        dict: tmdb_id -> (director_name, list_of_actor_names)
+    """
+    rows = conn.execute("SELECT tmdb_id, director, actors FROM credits")
+    return {tmdb_id: (director, json.loads(actors)) for tmdb_id, director, actors in rows}
+
+
+def cache_credits(conn, tmdb_id, director, actors):
+    """
+    Store (or replace) one credits entry; the caller is responsible for committing.
+
+    Args:
+        conn (sqlite3.Connection): Open cache connection
+        tmdb_id (int): The TMDb movie ID
+        director (str): Director name, or None
+        actors (list): Actor names
+    """
+    conn.execute(
+        "INSERT OR REPLACE INTO credits (tmdb_id, director, actors, fetched_at) VALUES (?, ?, ?, ?)",
+        (tmdb_id, director, json.dumps(actors), int(time.time()))
+    )
+
+
+def get_movie_details(tmdb_id, api_key, limiter=None, session=_session):
     """
     Fetch director and top 5 actors for a movie from TMDb API.
 
     Args:
         tmdb_id (int): The TMDb movie ID
         api_key (str): TMDb API key for authentication
+        limiter (RateLimiter): Optional limiter shared by concurrent callers
+        session (requests.Session): Session to send the request with
 
     Returns:
         tuple: (director_name, list_of_actor_names)
@@ -38,8 +151,11 @@ def get_movie_details(tmdb_id, api_key):
     params = {"api_key": api_key}
 
     try:
+        if limiter is not None:
+            limiter.acquire()
+
         # Make GET request to TMDb API
-        response = requests.get(url, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         response.raise_for_status()  # Raise exception for bad status codes
 
         # Parse JSON response
@@ -84,6 +200,7 @@ def main():
     movies_path = 'data/ml-latest-small/movies.csv'
     links_path = 'data/ml-latest-small/links.csv'
     output_path = 'data/processed/movies_enriched.csv'
+    cache_path = 'data/processed/tmdb_cache.db'
 
     # Check if input files exist
     if not os.path.exists(movies_path) or not os.path.exists(links_path):
@@ -99,38 +216,55 @@ def main():
     # Merge movies with their TMDb IDs
     merged_df = movies_df.merge(links_df, on='movieId', how='left')
 
-    # Create columns for enriched data
-    merged_df['director'] = None
-    merged_df['actors'] = None
-
-    print(f"Enriching {len(merged_df)} movies with TMDb data...")
-    print("This may take a while due to API rate limiting...")
-
-    # Iterate through each movie with progress bar
-    for idx, row in tqdm(merged_df.iterrows(), total=len(merged_df)):
-        tmdb_id = row['tmdbId']
-
-        # Skip if TMDb ID is missing
-        if pd.isna(tmdb_id):
-            continue
-
-        # Convert to integer for API call
-        tmdb_id = int(tmdb_id)
+    # Create output directory if it doesn't exist
+    os.makedirs('data/processed', exist_ok=True)
 
-        # Fetch movie details from TMDb
-        director, actors = get_movie_details(tmdb_id, api_key)
+    # Credits already fetched by an earlier (possibly interrupted) run are
+    # read from the local cache instead of being requested again
+    conn = open_credits_cache(cache_path)
+    results = load_cached_credits(conn)
 
-        # Store results in DataFrame
-        merged_df.at[idx, 'director'] = director
-        # Store actors as pipe-separated string for easy parsing later
-        merged_df.at[idx, 'actors'] = '|'.join(actors) if actors else None
+    # Each distinct TMDb ID only needs to be fetched once
+    tmdb_ids = merged_df['tmdbId'].dropna().astype(int).unique().tolist()
+    missing_ids = [tmdb_id for tmdb_id in tmdb_ids if tmdb_id not in results]
 
-        # Rate limiting: sleep to avoid overwhelming the API
-        # TMDb allows 40 requests per 10 seconds, so 0.25s per request is safe
-        time.sleep(0.25)
+    print(f"Enriching {len(merged_df)} movies with TMDb data...")
+    print(f"{len(tmdb_ids) - len(missing_ids)} TMDb IDs found in cache")
+    print(f"Fetching credits for {len(missing_ids)} TMDb IDs with {MAX_WORKERS} workers...")
 
-    # Create output directory if it doesn't exist
-    os.makedirs('data/processed', exist_ok=True)
+    # The work is network-bound, so threads overlap request latency while the
+    # shared limiter keeps the overall request rate within TMDb's limits
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+    pending_writes = 0
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(get_movie_details, tmdb_id, api_key, limiter): tmdb_id
+                for tmdb_id in missing_ids
+            }
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                tmdb_id = futures[future]
+                director, actors = future.result()
+                results[tmdb_id] = (director, actors)
+
+                # An empty result is also what a failed request returns, so
+                # only cache entries that actually carry credits
+                if director or actors:
+                    cache_credits(conn, tmdb_id, director, actors)
+                    pending_writes += 1
+                    if pending_writes >= CACHE_COMMIT_EVERY:
+                        conn.commit()
+                        pending_writes = 0
+    finally:
+        conn.commit()
+        conn.close()
+
+    # Map results back onto the DataFrame; movies without a TMDb ID stay empty
+    director_map = {tmdb_id: director for tmdb_id, (director, _) in results.items()}
+    # Store actors as pipe-separated string for easy parsing later
+    actors_map = {tmdb_id: '|'.join(actors) if actors else None for tmdb_id, (_, actors) in results.items()}
+    merged_df['director'] = merged_df['tmdbId'].map(director_map)
+    merged_df['actors'] = merged_df['tmdbId'].map(actors_map)
 
     # Save enriched data to CSV
     merged_df.to_csv(output_path, index=False)
@@ -17,11 +17,20 @@ Prerequisites:
 
 import pandas as pd
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 from tqdm import tqdm
 
 
+# Number of batches written concurrently; each worker holds its own session.
+# Invariant: WRITE_WORKERS <= MAX_CONNECTION_POOL_SIZE, or workers stall waiting
+# for a free connection instead of writing
+WRITE_WORKERS = 8
+MAX_CONNECTION_POOL_SIZE = 32
+
+
 class GraphLoader:
     """
     A class to manage loading data into the Neo4j knowledge graph.
@@ -36,7 +45,15 @@ class GraphLoader:
             user (str): Neo4j username
             password (str): Neo4j password
         """
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        # Keep pooled Bolt connections alive between batches so concurrent
+        # writers reuse them instead of reconnecting
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+            connection_acquisition_timeout=60,
+            keep_alive=True
+        )
         print(f"Connected to Neo4j at {uri}")
 
     def close(self):
@@ -59,6 +76,35 @@ class GraphLoader:
             result = session.run(query, parameters or {})
             return [record for record in result]
 
+    def _write_batch(self, query, batch):
+        """
+        Run a batched write query in its own session and transaction.
+
+        Args:
+            query (str): Cypher query reading its rows from $batch
+            batch (list): Rows to pass as the $batch parameter
+        """
+        with self.driver.session() as session:
+            session.execute_write(lambda tx: tx.run(query, batch=batch).consume())
+
+    def write_batches(self, query, rows, batch_size):
+        """
+        Split rows into batches and write them concurrently.
+
+        Concurrent MERGEs on shared nodes (genres, popular actors) can deadlock;
+        execute_write retries such transient errors on its own.
+
+        Args:
+            query (str): Cypher query reading its rows from $batch
+            rows (list): All rows to write
+            batch_size (int): Number of rows per transaction
+        """
+        batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            futures = [executor.submit(self._write_batch, query, batch) for batch in batches]
+            for future in tqdm(futures):
+                future.result()
+
     def create_constraints(self):
         """
         Create uniqueness constraints on node properties.
@@ -71,7 +117,9 @@ class GraphLoader:
             "CREATE CONSTRAINT IF NOT EXISTS FOR (u:User) REQUIRE u.userId IS UNIQUE",
             "CREATE CONSTRAINT IF NOT EXISTS FOR (g:Genre) REQUIRE g.name IS UNIQUE",
             "CREATE CONSTRAINT IF NOT EXISTS FOR (d:Director) REQUIRE d.name IS UNIQUE",
-            "CREATE CONSTRAINT IF NOT EXISTS FOR (a:Actor) REQUIRE a.name IS UNIQUE"
+            "CREATE CONSTRAINT IF NOT EXISTS FOR (a:Actor) REQUIRE a.name IS UNIQUE",
+            # Not unique, but indexed for the title lookups done by the visualizer
+            "CREATE INDEX movie_title_idx IF NOT EXISTS FOR (m:Movie) ON (m.title)"
         ]
 
         for constraint in constraints:
@@ -90,7 +138,7 @@ class GraphLoader:
     def load_movies_and_relations(self):
         """
         Load movies and their relationships with genres, directors, and actors.
-        Uses efficient batch processing with multi-part Cypher queries.
+        Movies are sent in batches of 500 through a single UNWIND query.
         """
         print("\nLoading movies, genres, directors, and actors...")
 
@@ -100,74 +148,77 @@ class GraphLoader:
             print(f"ERROR: {movies_path} not found. Run get_data.py first.")
             return
 
-        movies_df = pd.read_csv(movies_path)
+        # Only the columns the graph needs, with explicit types so pandas skips inference
+        movie_columns = ['movieId', 'title', 'genres', 'director', 'actors']
+        movies_df = pd.read_csv(
+            movies_path,
+            usecols=movie_columns,
+            dtype={'movieId': 'int32', 'title': str, 'genres': str, 'director': str, 'actors': str}
+        )[movie_columns]
         print(f"Found {len(movies_df)} movies to load")
 
-        # Process each movie
-        with self.driver.session() as session:
-            for idx, row in tqdm(movies_df.iterrows(), total=len(movies_df)):
-                movie_id = int(row['movieId'])
-                title = str(row['title'])
-
-                # Parse genres (format: "Action|Adventure|Sci-Fi")
-                genres = []
-                if pd.notna(row['genres']) and row['genres'] != '(no genres listed)':
-                    genres = [g.strip() for g in str(row['genres']).split('|')]
-
-                # Parse director
-                director = None
-                if pd.notna(row['director']):
-                    director = [str(row['director'])]
-
-                # Parse actors (format: "Actor1|Actor2|Actor3")
-                actors = []
-                if pd.notna(row['actors']):
-                    actors = [a.strip() for a in str(row['actors']).split('|')]
-
-                # Build comprehensive Cypher query
-                # This single query creates the movie and all its relationships
-                query = """
-                // Create or merge the movie node
-                MERGE (m:Movie {movieId: $movieId})
-                SET m.title = $title
-
-                // Create director relationship if director exists
-                WITH m
-                FOREACH (director_name IN CASE WHEN $director IS NOT NULL THEN $director ELSE [] END |
-                    MERGE (d:Director {name: director_name})
-                    MERGE (d)-[:DIRECTED]->(m)
-                )
-
-                // Create actor relationships if actors exist
-                WITH m
-                FOREACH (actor_name IN CASE WHEN $actors IS NOT NULL THEN $actors ELSE [] END |
-                    MERGE (a:Actor {name: actor_name})
-                    MERGE (a)-[:ACTED_IN]->(m)
-                )
-
-                // Create genre relationships if genres exist
-                WITH m
-                FOREACH (genre_name IN CASE WHEN $genres IS NOT NULL THEN $genres ELSE [] END |
-                    MERGE (g:Genre {name: genre_name})
-                    MERGE (m)-[:HAS_GENRE]->(g)
-                )
-                """
-
-                # Execute query with parameters
-                session.run(query, {
-                    'movieId': movie_id,
-                    'title': title,
-                    'director': director if director else None,
-                    'actors': actors if actors else None,
-                    'genres': genres if genres else None
-                })
+        # Keep movies by the same director together so that concurrent batches
+        # contend less for the same Director and Actor nodes
+        movies_df = movies_df.sort_values('director', kind='stable')
+
+        # Split the pipe-separated columns once for the whole frame
+        # (format: "Action|Adventure|Sci-Fi", "Actor1|Actor2|Actor3")
+        listed_genres = movies_df['genres'].where(movies_df['genres'] != '(no genres listed)')
+        movies_df['genres'] = listed_genres.str.strip().str.split(r'\s*\|\s*', regex=True)
+        movies_df['actors'] = movies_df['actors'].str.strip().str.split(r'\s*\|\s*', regex=True)
+
+        # Replace NaN with None so missing values reach Cypher as null
+        movies_df = movies_df.astype(object).where(movies_df.notna(), None)
+
+        # One plain dict per movie for the batched query
+        movies = [
+            {'movieId': int(movie_id), 'title': title, 'director': director, 'actors': actors, 'genres': genres}
+            for movie_id, title, genres, director, actors in movies_df.itertuples(index=False, name=None)
+        ]
+
+        # Build comprehensive Cypher query
+        # This single query creates a batch of movies and all their relationships
+        query = """
+        UNWIND $batch AS row
+
+        // Create or merge the movie node
+        MERGE (m:Movie {movieId: row.movieId})
+        SET m.title = row.title
+
+        // Create director relationship if director exists
+        FOREACH (director_name IN CASE WHEN row.director IS NULL THEN [] ELSE [row.director] END |
+            MERGE (d:Director {name: director_name})
+            MERGE (d)-[:DIRECTED]->(m)
+        )
+
+        // Create actor relationships if actors exist
+        FOREACH (actor_name IN coalesce(row.actors, []) |
+            MERGE (a:Actor {name: actor_name})
+            MERGE (a)-[:ACTED_IN]->(m)
+        )
+
+        // Create genre relationships if genres exist
+        FOREACH (genre_name IN coalesce(row.genres, []) |
+            MERGE (g:Genre {name: genre_name})
+            MERGE (m)-[:HAS_GENRE]->(g)
+        )
+        """
+
+        # Send movies in batches, one explicit write transaction per batch,
+        # instead of one auto-commit round-trip per movie
+        self.write_batches(query, movies, batch_size=500)
 
         print("Movies and relationships loaded successfully")
 
-    def load_users_and_ratings(self):
+    def load_users_and_ratings(self, import_dir=None):
         """
         Load users and their movie ratings.
         Creates User nodes and RATED relationships to Movie nodes.
+
+        Args:
+            import_dir (str): Neo4j server import directory. When given, the
+                ratings file is copied there and loaded server-side with
+                LOAD CSV; otherwise rows are sent through the driver.
         """
         print("\nLoading users and ratings...")
 
@@ -177,39 +228,67 @@ class GraphLoader:
             print(f"ERROR: {ratings_path} not found.")
             return
 
-        ratings_df = pd.read_csv(ratings_path)
+        if import_dir:
+            try:
+                shutil.copy(ratings_path, os.path.join(import_dir, 'ratings.csv'))
+            except OSError as e:
+                print(f"Could not copy ratings into {import_dir} ({e}), loading through the driver instead")
+            else:
+                self.load_ratings_from_csv('ratings.csv')
+                print("Users and ratings loaded successfully")
+                return
+
+        ratings_df = pd.read_csv(
+            ratings_path,
+            dtype={'userId': 'int64', 'movieId': 'int64', 'rating': 'float64', 'timestamp': 'int64'}
+        )
         print(f"Found {len(ratings_df)} ratings to load")
 
-        # Process ratings in batches for better performance
-        batch_size = 1000
-        with self.driver.session() as session:
-            for i in tqdm(range(0, len(ratings_df), batch_size)):
-                batch = ratings_df.iloc[i:i + batch_size]
-
-                # Prepare batch data
-                ratings_batch = []
-                for _, row in batch.iterrows():
-                    ratings_batch.append({
-                        'userId': int(row['userId']),
-                        'movieId': int(row['movieId']),
-                        'rating': float(row['rating']),
-                        'timestamp': int(row['timestamp'])
-                    })
-
-                # Batch insert query
-                query = """
-                UNWIND $ratings AS rating
-                MERGE (u:User {userId: rating.userId})
-                WITH u, rating
-                MATCH (m:Movie {movieId: rating.movieId})
-                MERGE (u)-[r:RATED]->(m)
-                SET r.rating = rating.rating, r.timestamp = rating.timestamp
-                """
-
-                session.run(query, {'ratings': ratings_batch})
+        # Prepare rating rows; to_dict yields native Python ints and floats
+        ratings = ratings_df.to_dict('records')
+
+        # Batch insert query
+        query = """
+        UNWIND $batch AS rating
+        MERGE (u:User {userId: rating.userId})
+        WITH u, rating
+        MATCH (m:Movie {movieId: rating.movieId})
+        MERGE (u)-[r:RATED]->(m)
+        SET r.rating = rating.rating, r.timestamp = rating.timestamp
+        """
+
+        # Process ratings in batches for better performance; the file is
+        # ordered by user, so concurrent batches rarely touch the same User
+        self.write_batches(query, ratings, batch_size=1000)
 
         print("Users and ratings loaded successfully")
 
+    def load_ratings_from_csv(self, file_name):
+        """
+        Load ratings with LOAD CSV, streaming the file inside the Neo4j server.
+
+        This skips Python-side parsing and Bolt round-trips entirely, but the
+        file must already be in the server's import directory.
+
+        Args:
+            file_name (str): CSV file name relative to the import directory
+        """
+        print(f"Loading ratings server-side from file:///{file_name}...")
+
+        # CALL { ... } IN TRANSACTIONS needs an auto-commit transaction,
+        # which is what run_query uses
+        query = """
+        LOAD CSV WITH HEADERS FROM $url AS row
+        CALL {
+            WITH row
+            MATCH (m:Movie {movieId: toInteger(row.movieId)})
+            MERGE (u:User {userId: toInteger(row.userId)})
+            MERGE (u)-[r:RATED]->(m)
+            SET r.rating = toFloat(row.rating), r.timestamp = toInteger(row.timestamp)
+        } IN TRANSACTIONS OF 10000 ROWS
+        """
+        self.run_query(query, {'url': f"file:///{file_name}"})
+
     def print_statistics(self):
         """
         Print statistics about the loaded graph.
@@ -247,6 +326,7 @@ def main():
     uri = os.getenv('NEO4J_URI')
     user = os.getenv('NEO4J_USER')
     password = os.getenv('NEO4J_PASSWORD')
+    import_dir = os.getenv('NEO4J_IMPORT_DIR')
 
     # Validate credentials
     if not all([uri, user, password]) or password == "YOUR_NEO4J_PASSWORD_HERE":
@@ -260,7 +340,7 @@ def main():
         # Execute loading steps in order
         loader.create_constraints()
         loader.load_movies_and_relations()
-        loader.load_users_and_ratings()
+        loader.load_users_and_ratings(import_dir)
         loader.print_statistics()
 
         print("\n✓ Graph loading complete!")
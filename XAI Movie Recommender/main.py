@@ -16,8 +16,16 @@ Endpoints:
     GET /health - Health check endpoint
 """
 
-from fastapi import FastAPI, HTTPException, Path
+import hashlib
+import os
+import time
+from fastapi import FastAPI, HTTPException, Path, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
+from neo4j import AsyncGraphDatabase, AsyncDriver
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from recommender import XAIRecommender
@@ -40,6 +48,19 @@ class RecommendationResponse(BaseModel):
     message: Optional[str] = Field(None, description="Optional message (e.g., error or info message)")
 
 
+class RatedMovie(BaseModel):
+    """Model for a movie the user has rated."""
+    movie_id: int = Field(..., description="MovieLens movie ID")
+    title: str = Field(..., description="Title of the rated movie")
+    rating: float = Field(..., description="Rating the user gave the movie")
+
+
+class RecommendOrFallbackResponse(RecommendationResponse):
+    """Model for recommendations that fall back to the user's rating history."""
+    mode: str = Field(..., description="'recommendations' or 'rated_movies' depending on which data is populated")
+    rated_movies: List[RatedMovie] = Field(default_factory=list, description="Recently rated movies (fallback mode only)")
+
+
 class HealthResponse(BaseModel):
     """Model for health check response."""
     status: str
@@ -53,7 +74,8 @@ app = FastAPI(
     description="An Explainable AI system for movie recommendations using knowledge graphs and Node2Vec",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson serializes responses several times faster than stdlib json
 )
 
 # Add CORS middleware to allow cross-origin requests (needed for web frontends)
@@ -65,20 +87,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (recommendations, graph paths); same threshold as nginx.conf
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global recommender instance
 # Initialize on startup to avoid recreating for each request
 recommender: Optional[XAIRecommender] = None
 
+# Async driver for the Cypher queries the endpoints run directly, so waiting on
+# Neo4j yields to the event loop instead of holding a threadpool worker
+async_driver: Optional[AsyncDriver] = None
+
+# Last component probe made by /health, reused for HEALTH_CACHE_TTL seconds so
+# frequent polling (load balancers, frontends) doesn't open a Neo4j session per call
+HEALTH_CACHE_TTL = 5.0
+_health_cache = {'ts': float('-inf'), 'model_loaded': False, 'neo4j_connected': False}
+
 
 @app.on_event("startup")
 async def startup_event():
     """
     Initialize the recommender system when the application starts.
     """
-    global recommender
+    global recommender, async_driver
     try:
         print("Initializing XAI Recommender...")
         recommender = XAIRecommender()
+        async_driver = AsyncGraphDatabase.driver(
+            os.getenv('NEO4J_URI'),
+            auth=(os.getenv('NEO4J_USER'), os.getenv('NEO4J_PASSWORD'))
+        )
         print("✓ Recommender initialized successfully")
     except Exception as e:
         print(f"✗ Error initializing recommender: {e}")
@@ -90,13 +128,95 @@ async def shutdown_event():
     """
     Clean up resources when the application shuts down.
     """
-    global recommender
+    global recommender, async_driver
     if recommender:
         print("Closing recommender connections...")
         recommender.close()
+        if async_driver:
+            await async_driver.close()
         print("✓ Connections closed")
 
 
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (comma-separated tags or '*')
+        etag: The ETag of the current representation
+
+    Returns:
+        bool: True if any listed tag matches, ignoring W/ prefixes
+    """
+    opaque_tag = etag.removeprefix('W/')
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == opaque_tag:
+            return True
+    return False
+
+
+def etag_response(request: Request, payload) -> Response:
+    """
+    Serialize a payload as JSON with an ETag, honouring If-None-Match.
+
+    Clients that send back the ETag of an unchanged payload get an empty
+    304 response instead of the full body. The tag is weak because it is
+    computed on the uncompressed body, which GZipMiddleware may re-encode.
+
+    Args:
+        request: The incoming request (checked for If-None-Match)
+        payload: Response data (dict or Pydantic model)
+
+    Returns:
+        Response: 200 JSON response with an ETag header, or a bodiless 304
+    """
+    response = ORJSONResponse(jsonable_encoder(payload))
+    etag = f'W/"{hashlib.sha1(response.body).hexdigest()}"'
+
+    if etag_matches(request.headers.get('if-none-match', ''), etag):
+        return Response(status_code=304, headers={'ETag': etag})
+
+    response.headers['ETag'] = etag
+    return response
+
+
+async def explain_recommendations(source_movie: str, recommendations: List[dict]) -> List[Recommendation]:
+    """
+    Attach a knowledge-graph explanation to each recommendation.
+
+    Recommendations that already carry an explanation keep it; the rest are
+    fetched with one bulk lookup, run in the threadpool so the Neo4j
+    round-trip doesn't block the event loop.
+
+    Args:
+        source_movie: Title of the movie the recommendations are based on
+        recommendations: Recommendations as returned by the recommender
+
+    Returns:
+        list: Recommendation models with explanations
+    """
+    explanations = {rec['title']: rec['explanation'] for rec in recommendations if 'explanation' in rec}
+    missing = [rec['title'] for rec in recommendations if rec['title'] not in explanations]
+
+    if missing:
+        explanations.update(await run_in_threadpool(
+            recommender.get_explanations_bulk,
+            source_movie,
+            missing
+        ))
+
+    return [
+        Recommendation(
+            movie_title=rec['title'],
+            movie_id=rec['movieId'],
+            explanation=f"Recommended because {explanations[rec['title']]}",
+            similarity=rec['similarity']
+        )
+        for rec in recommendations
+    ]
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -108,45 +228,66 @@ async def root():
         "docs": "/docs",
         "endpoints": {
             "user_recommendations": "/recommend/{user_id}",
+            "user_recommendations_or_fallback": "/user/{user_id}/recommend-or-fallback",
             "guest_recommendations": "/recommend/by-movie/{movie_title}",
             "movie_search": "/movies/search?q={query}",
+            "movie_titles": "/movies/titles",
             "user_rated_movies": "/user/{user_id}/rated",
             "health": "/health"
         }
     }
 
 
+async def probe_neo4j() -> bool:
+    """
+    Check that Neo4j answers a trivial query.
+
+    Returns:
+        bool: True if the query succeeded
+    """
+    try:
+        async with async_driver.session(database=recommender.db_name) as session:
+            result = await session.run("RETURN 1")
+            await result.single()
+            return True
+    except Exception:
+        return False
+
+
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint to verify the API and its dependencies are working.
 
+    Component checks are cached for HEALTH_CACHE_TTL seconds. Supports
+    conditional requests: send the last ETag in If-None-Match to get a 304
+    when the status hasn't changed.
+
     Returns:
         HealthResponse: Status of the API and its components
     """
-    model_loaded = False
-    neo4j_connected = False
+    if time.monotonic() - _health_cache['ts'] >= HEALTH_CACHE_TTL:
+        model_loaded = False
+        neo4j_connected = False
 
-    if recommender:
-        # Check if model is loaded
-        model_loaded = recommender.wv is not None
-
-        # Check if Neo4j is connected
-        try:
-            with recommender.driver.session() as session:
-                result = session.run("RETURN 1")
-                result.single()
-                neo4j_connected = True
-        except Exception:
-            neo4j_connected = False
+        if recommender:
+            # Check if model is loaded
+            model_loaded = recommender.wv is not None
 
+            # Check if Neo4j is connected
+            neo4j_connected = await probe_neo4j()
+
+        _health_cache.update(ts=time.monotonic(), model_loaded=model_loaded, neo4j_connected=neo4j_connected)
+
+    model_loaded = _health_cache['model_loaded']
+    neo4j_connected = _health_cache['neo4j_connected']
     status = "healthy" if (model_loaded and neo4j_connected) else "unhealthy"
 
-    return HealthResponse(
+    return etag_response(request, HealthResponse(
         status=status,
         model_loaded=model_loaded,
         neo4j_connected=neo4j_connected
-    )
+    ))
 
 
 @app.get("/recommend/{user_id}", response_model=RecommendationResponse, tags=["Recommendations"])
@@ -179,7 +320,7 @@ async def get_recommendations(
 
     try:
         # Get recommendations from the recommender system
-        result = recommender.get_recommendations(user_id, n=n)
+        result = await run_in_threadpool(recommender.get_recommendations, user_id, n=n)
 
         # If no source movie found or no recommendations
         if not result.get('source_movie'):
@@ -189,29 +330,10 @@ async def get_recommendations(
                 message=result.get('message', f"No 5-star ratings found for user {user_id}")
             )
 
-        # Build list of recommendations with explanations
-        recommendations_with_explanations = []
-
-        for rec in result['recommendations']:
-            # Get explanation for this recommendation
-            explanation = recommender.get_explanation(
-                result['source_movie'],
-                rec['title']
-            )
-
-            recommendations_with_explanations.append(
-                Recommendation(
-                    movie_title=rec['title'],
-                    movie_id=rec['movieId'],
-                    explanation=f"Recommended because {explanation}",
-                    similarity=rec['similarity']
-                )
-            )
-
         return RecommendationResponse(
             source_movie=result['source_movie'],
             source_movie_id=result.get('source_movie_id'),
-            recommendations=recommendations_with_explanations,
+            recommendations=await explain_recommendations(result['source_movie'], result['recommendations']),
             message=None
         )
 
@@ -222,6 +344,80 @@ async def get_recommendations(
         )
 
 
+async def fetch_user_rated_movies(user_id: int, limit: int) -> List[dict]:
+    """
+    Query the most recently rated movies for a user.
+
+    Args:
+        user_id: The MovieLens user ID
+        limit: Maximum number of movies to return
+
+    Returns:
+        list: Rated movies as dicts with movie_id, title and rating
+    """
+    async with async_driver.session(database=recommender.db_name) as session:
+        query = """
+        MATCH (u:User {userId: $userId})-[r:RATED]->(m:Movie)
+        RETURN m.title AS title, m.movieId AS movieId, r.rating AS rating
+        ORDER BY r.timestamp DESC
+        LIMIT $limit
+        """
+        result = await session.run(query, {'userId': user_id, 'limit': limit})
+
+        movies = []
+        async for record in result:
+            movies.append({
+                'movie_id': record['movieId'],
+                'title': record['title'],
+                'rating': record['rating']
+            })
+
+        return movies
+
+
+@app.get("/user/{user_id}/recommend-or-fallback", response_model=RecommendOrFallbackResponse, tags=["Recommendations"])
+async def get_recommendations_or_fallback(
+    user_id: int = Path(..., description="The MovieLens user ID", ge=1),
+    n: int = 5,
+    fallback_limit: int = 10
+):
+    """
+    Get recommendations for a user, or their rating history if none can be made.
+
+    Lets clients render either outcome from a single round-trip instead of
+    calling /user/{user_id}/rated after an empty recommendation response.
+
+    Args:
+        user_id: The MovieLens user ID
+        n: Number of recommendations to return (default: 5)
+        fallback_limit: Number of rated movies to return in fallback mode (default: 10)
+
+    Returns:
+        RecommendOrFallbackResponse: Recommendations, or rated movies when mode is 'rated_movies'
+
+    Raises:
+        HTTPException: If the recommender is not initialized or an error occurs
+    """
+    response = await get_recommendations(user_id=user_id, n=n)
+
+    if response.recommendations or not response.message:
+        return RecommendOrFallbackResponse(mode='recommendations', **response.model_dump())
+
+    try:
+        rated_movies = await fetch_user_rated_movies(user_id, fallback_limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching user movies: {str(e)}"
+        )
+
+    return RecommendOrFallbackResponse(
+        mode='rated_movies',
+        **response.model_dump(),
+        rated_movies=rated_movies
+    )
+
+
 @app.get("/user/{user_id}/rated", tags=["Users"])
 async def get_user_rated_movies(
     user_id: int = Path(..., description="The MovieLens user ID", ge=1),
@@ -247,28 +443,13 @@ async def get_user_rated_movies(
         )
 
     try:
-        with recommender.driver.session() as session:
-            query = """
-            MATCH (u:User {userId: $userId})-[r:RATED]->(m:Movie)
-            RETURN m.title AS title, m.movieId AS movieId, r.rating AS rating
-            ORDER BY r.timestamp DESC
-            LIMIT $limit
-            """
-            result = session.run(query, {'userId': user_id, 'limit': limit})
-
-            movies = []
-            for record in result:
-                movies.append({
-                    'movie_id': record['movieId'],
-                    'title': record['title'],
-                    'rating': record['rating']
-                })
+        movies = await fetch_user_rated_movies(user_id, limit)
 
-            return {
-                'user_id': user_id,
-                'rated_movies': movies,
-                'count': len(movies)
-            }
+        return {
+            'user_id': user_id,
+            'rated_movies': movies,
+            'count': len(movies)
+        }
 
     except Exception as e:
         raise HTTPException(
@@ -279,12 +460,16 @@ async def get_user_rated_movies(
 
 @app.get("/movies/search", tags=["Movies"])
 async def search_movies(
+    request: Request,
     q: str,
     limit: int = 10
 ):
     """
     Search for movies by title (fuzzy matching).
 
+    Responses carry an ETag; repeat searches that send it in If-None-Match
+    get a 304 instead of the full result list.
+
     Args:
         q: Search query (partial movie title)
         limit: Maximum number of results to return (default: 10)
@@ -308,12 +493,12 @@ async def search_movies(
         )
 
     try:
-        movies = recommender.search_movies(q, limit=limit)
-        return {
+        movies = await run_in_threadpool(recommender.search_movies, q, limit=limit)
+        return etag_response(request, {
             'query': q,
             'results': movies,
             'count': len(movies)
-        }
+        })
 
     except Exception as e:
         raise HTTPException(
@@ -322,6 +507,41 @@ async def search_movies(
         )
 
 
+@app.get("/movies/titles", tags=["Movies"])
+async def get_movie_titles(request: Request):
+    """
+    Get the full, alphabetically sorted list of movie titles.
+
+    Clients can cache this list and filter it locally for autocomplete
+    instead of calling /movies/search on every query. Send the last ETag in
+    If-None-Match to revalidate a cached copy with a bodiless 304.
+
+    Returns:
+        dict: All movie titles
+
+    Raises:
+        HTTPException: If an error occurs
+    """
+    if not recommender:
+        raise HTTPException(
+            status_code=503,
+            detail="Recommender system not initialized"
+        )
+
+    try:
+        titles = recommender.get_all_movie_titles()
+        return etag_response(request, {
+            'titles': titles,
+            'count': len(titles)
+        })
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching movie titles: {str(e)}"
+        )
+
+
 @app.get("/recommend/by-movie/{movie_title}", response_model=RecommendationResponse, tags=["Recommendations"])
 async def get_recommendations_by_movie(
     movie_title: str = Path(..., description="The movie title to base recommendations on"),
@@ -351,7 +571,7 @@ async def get_recommendations_by_movie(
 
     try:
         # Get recommendations from the recommender system
-        result = recommender.get_recommendations_by_movie(movie_title, n=n)
+        result = await run_in_threadpool(recommender.get_recommendations_by_movie, movie_title, n=n)
 
         # If no source movie found or no recommendations
         if not result.get('source_movie'):
@@ -361,29 +581,10 @@ async def get_recommendations_by_movie(
                 message=result.get('message', f"Movie '{movie_title}' not found")
             )
 
-        # Build list of recommendations with explanations
-        recommendations_with_explanations = []
-
-        for rec in result['recommendations']:
-            # Get explanation for this recommendation
-            explanation = recommender.get_explanation(
-                result['source_movie'],
-                rec['title']
-            )
-
-            recommendations_with_explanations.append(
-                Recommendation(
-                    movie_title=rec['title'],
-                    movie_id=rec['movieId'],
-                    explanation=f"Recommended because {explanation}",
-                    similarity=rec['similarity']
-                )
-            )
-
         return RecommendationResponse(
             source_movie=result['source_movie'],
             source_movie_id=result.get('source_movie_id'),
-            recommendations=recommendations_with_explanations,
+            recommendations=await explain_recommendations(result['source_movie'], result['recommendations']),
             message=None
         )
 
@@ -394,6 +595,33 @@ async def get_recommendations_by_movie(
         )
 
 
+async def fetch_path_record(source_id: Optional[int], target_id: Optional[int]):
+    """
+    Query one path of at most two hops between two movies.
+
+    Args:
+        source_id: MovieLens ID of the source movie
+        target_id: MovieLens ID of the target movie
+
+    Returns:
+        Record: pathNodes and pathRels of the path, or None if there is none
+    """
+    async with async_driver.session(database=recommender.db_name) as session:
+        # Query to find path between movies
+        query = """
+        MATCH (m1:Movie {movieId: $source}), (m2:Movie {movieId: $target})
+        WHERE m1 <> m2
+        MATCH path = shortestPath((m1)-[:ACTED_IN|DIRECTED|HAS_GENRE*1..2]-(m2))
+        RETURN nodes(path) AS pathNodes, relationships(path) AS pathRels
+        """
+        result = await session.run(query, {
+            'source': source_id,
+            'target': target_id
+        })
+
+        return await result.single()
+
+
 @app.get("/graph/path/{source_title}/{target_title}", tags=["Graph"])
 async def get_recommendation_path(
     source_title: str = Path(..., description="Source movie title"),
@@ -419,70 +647,61 @@ async def get_recommendation_path(
         )
 
     try:
-        with recommender.driver.session() as session:
-            # Query to find path between movies
-            query = """
-            MATCH path = (m1:Movie {title: $source})-[*1..2]-(m2:Movie {title: $target})
-            WITH path, nodes(path) as pathNodes, relationships(path) as pathRels
-            RETURN pathNodes, pathRels
-            LIMIT 1
-            """
-            result = session.run(query, {
-                'source': source_title,
-                'target': target_title
-            })
-
-            record = result.single()
+        # Match on the indexed movieId rather than scanning titles
+        source_id = recommender.get_movie_id(source_title)
+        target_id = recommender.get_movie_id(target_title)
 
-            if not record:
-                return {
-                    'nodes': [],
-                    'edges': [],
-                    'message': 'No path found between these movies'
-                }
+        record = await fetch_path_record(source_id, target_id)
 
-            nodes_data = record['pathNodes']
-            rels_data = record['pathRels']
+        if not record:
+            return {
+                'nodes': [],
+                'edges': [],
+                'message': 'No path found between these movies'
+            }
 
-            # Build nodes list
-            nodes = []
-            node_map = {}
+        nodes_data = record['pathNodes']
+        rels_data = record['pathRels']
 
-            for i, node in enumerate(nodes_data):
-                labels = list(node.labels)
-                node_type = labels[0] if labels else 'Unknown'
+        # Build nodes list
+        nodes = []
+        node_map = {}
 
-                if node_type == 'Movie':
-                    label = node.get('title', 'Unknown Movie')
-                else:
-                    label = node.get('name', 'Unknown')
+        for i, node in enumerate(nodes_data):
+            labels = list(node.labels)
+            node_type = labels[0] if labels else 'Unknown'
 
-                node_id = f"{node_type}_{i}"
-                node_map[node.id] = node_id
+            if node_type == 'Movie':
+                label = node.get('title', 'Unknown Movie')
+            else:
+                label = node.get('name', 'Unknown')
 
-                nodes.append({
-                    'id': node_id,
-                    'label': label,
-                    'type': node_type
-                })
+            node_id = f"{node_type}_{i}"
+            node_map[node.id] = node_id
 
-            # Build edges list
-            edges = []
-            for rel in rels_data:
-                source_id = node_map.get(rel.start_node.id)
-                target_id = node_map.get(rel.end_node.id)
+            nodes.append({
+                'id': node_id,
+                'label': label,
+                'type': node_type
+            })
 
-                if source_id and target_id:
-                    edges.append({
-                        'source': source_id,
-                        'target': target_id,
-                        'type': rel.type
-                    })
+        # Build edges list
+        edges = []
+        for rel in rels_data:
+            start_key = node_map.get(rel.start_node.id)
+            end_key = node_map.get(rel.end_node.id)
+
+            if start_key and end_key:
+                edges.append({
+                    'source': start_key,
+                    'target': end_key,
+                    'type': rel.type
+                })
 
-            return {
-                'nodes': nodes,
-                'edges': edges
-            }
+        return {
+            'nodes': nodes,
+            'edges': edges
+        }
 
     except Exception as e:
         raise HTTPException(
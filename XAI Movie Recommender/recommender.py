@@ -10,12 +10,89 @@ movies are being recommended.
 """
 
 import os
-from neo4j import GraphDatabase
+import re
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from neo4j import GraphDatabase, RoutingControl
 from gensim.models import KeyedVectors
 import numpy as np
 from dotenv import load_dotenv
 
 
+# Maximum number of (source, recommended) explanation pairs kept in memory
+EXPLANATION_CACHE_SIZE = 50000
+
+# Seconds before the precomputed user -> seed movie map is rebuilt
+USER_SEED_TTL = 3600
+
+# Maximum number of (user, source movie, n) recommendation responses kept in memory
+RECOMMENDATION_CACHE_SIZE = 4096
+
+# Seconds a cached recommendation response is served before it is recomputed,
+# bounding how long a newly rated movie can still be recommended
+RECOMMENDATION_CACHE_TTL = 300
+
+# Number of distinct fuzzy title searches whose results are kept in memory
+FUZZY_SEARCH_CACHE_SIZE = 1024
+
+# Characters with a meaning in Lucene query syntax, escaped in user input
+LUCENE_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+# Indexes the recommender's lookups rely on. Movie.movieId and User.userId are
+# already indexed by the uniqueness constraints created in load_graph.py.
+INDEX_STATEMENTS = [
+    "CREATE INDEX movie_title_idx IF NOT EXISTS FOR (m:Movie) ON (m.title)",
+    "CREATE FULLTEXT INDEX movieTitleFulltext IF NOT EXISTS FOR (m:Movie) ON EACH [m.title]",
+]
+
+# Per-request queries are kept as constants so every call sends identical text
+# and reuses the execution plan Neo4j cached for it (see _warm_up)
+
+# Drop candidates the user has already rated (or that aren't in the database),
+# keep the best n in candidate order, and return their titles plus a path from
+# the source movie to explain each one
+RECOMMENDATION_QUERY = """
+OPTIONAL MATCH (u:User {userId: $userId})
+MATCH (src:Movie {movieId: $sourceId})
+UNWIND range(0, size($candidates) - 1) AS idx
+WITH u, src, idx, $candidates[idx] AS candidateId
+MATCH (c:Movie {movieId: candidateId})
+WHERE u IS NULL OR NOT (u)-[:RATED]->(c)
+WITH src, c, idx
+ORDER BY idx
+LIMIT $n
+OPTIONAL MATCH path = shortestPath((src)-[:ACTED_IN|DIRECTED|HAS_GENRE*..2]-(c))
+RETURN c.movieId AS movieId, c.title AS title, path
+"""
+
+# A shortest path of at most two hops (e.g., Movie-Actor-Movie) from the source
+# to each target; shortestPath runs a bounded BFS between the two indexed
+# endpoints instead of enumerating every path. Only the relationship types an
+# explanation can describe are followed, so the BFS never fans out through the
+# RATED edges of every user who watched the movie.
+EXPLANATION_PATHS_QUERY = """
+MATCH (m1:Movie {movieId: $source_id})
+UNWIND $targets AS target
+MATCH (m2:Movie {movieId: target.movieId})
+WHERE m2 <> m1
+MATCH path = shortestPath((m1)-[:ACTED_IN|DIRECTED|HAS_GENRE*1..2]-(m2))
+RETURN target.title AS title, path
+"""
+
+# Fuzzy title search through the Lucene-backed full-text index
+FUZZY_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes('movieTitleFulltext', $query)
+YIELD node, score
+RETURN node.movieId AS movieId, node.title AS title
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+
 class XAIRecommender:
     """
     Explainable AI Movie Recommender System.
@@ -38,6 +115,28 @@ class XAIRecommender:
 
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
 
+        # Naming the database up front saves the driver a home-database
+        # lookup on every query
+        self.db_name = os.getenv('NEO4J_DATABASE', 'neo4j')
+        self._ensure_indexes()
+
+        # Resolve titles to IDs in memory so graph queries can match on the
+        # indexed movieId instead of scanning Movie nodes by title
+        self._title_to_id, self._id_to_title = self._load_movie_index()
+
+        # Lower-cased titles for in-process search, in alphabetical order
+        self._search_index = sorted(
+            (title.lower(), movie_id, title) for title, movie_id in self._title_to_id.items()
+        )
+
+        # Guards the title dicts and search index when titles found after
+        # startup are added; readers never take it, since writers swap in new
+        # copies instead of mutating the ones being read
+        self._movie_index_lock = threading.Lock()
+
+        # Per-instance memo of full-text search results, keyed by (query, limit)
+        self._fuzzy_search = lru_cache(maxsize=FUZZY_SEARCH_CACHE_SIZE)(self._query_fulltext)
+
         # Load the trained Node2Vec model
         model_path = 'models/node2vec.model'
         if not os.path.exists(model_path):
@@ -48,36 +147,189 @@ class XAIRecommender:
         self.wv = KeyedVectors.load(model_path)
         print(f"Loaded Node2Vec model with {len(self.wv)} node embeddings")
 
+        # Only movies can be recommended, so similarity searches run against a
+        # movie-only view instead of every actor, genre, director and user node
+        movie_keys = [
+            key for key in self.wv.index_to_key
+            if key.startswith('movie_') and key[len('movie_'):].isdigit()
+        ]
+        self._movie_ids_sorted = np.array([int(key[len('movie_'):]) for key in movie_keys], dtype=np.int64)
+
+        # Embeddings never change after loading, so normalize them once; cosine
+        # similarity is then a single matrix-vector product per query. The view
+        # stores only the normalized copy, so the movie matrix isn't held twice.
+        movie_vectors = self.wv[movie_keys]
+        norms = np.linalg.norm(movie_vectors, axis=1, keepdims=True)
+        self.movie_wv = KeyedVectors(vector_size=self.wv.vector_size)
+        self.movie_wv.add_vectors(movie_keys, (movie_vectors / np.where(norms == 0, 1, norms)).astype(np.float32))
+        self._movie_unit = self.movie_wv.vectors
+
+        # movieId -> row of _movie_unit, parsed once here so requests never
+        # build or split 'movie_<id>' keys
+        self._movie_row = {movie_id: row for row, movie_id in enumerate(self._movie_ids_sorted.tolist())}
+        print(f"Indexed {len(self.movie_wv)} movie embeddings for similarity search")
+
+        # Each user's most recent 5-star movie, precomputed with one bulk query
+        # so recommendations skip the per-request seed lookup
+        self._user_seed_lock = threading.Lock()
+        self._user_seed, self._user_seed_loaded_at = self._load_user_seeds(), time.monotonic()
+
+        # Explanations depend only on the graph, which doesn't change while the
+        # API is running, so the same pair can be answered from memory for every user.
+        # LRU order is kept by the OrderedDict; the lock makes it safe across API threads.
+        self._explanations = OrderedDict()
+        self._explanations_lock = threading.Lock()
+
+        # Full recommendation responses keyed by (userId, source movieId, n).
+        # A new 5-star rating changes the source movie and so the key; entries
+        # also expire after RECOMMENDATION_CACHE_TTL to pick up other ratings.
+        self._recommendations = OrderedDict()
+        self._recommendations_lock = threading.Lock()
+
+        self._warm_up()
+
     def close(self):
         """Close the Neo4j driver connection."""
         self.driver.close()
 
-    def _get_movie_node_id(self, movie_id):
+    def _read(self, query, **parameters):
+        """
+        Run a read-only query through the driver's managed execute_query API.
+
+        Args:
+            query (str): Parameterized Cypher query
+            **parameters: Query parameters
+
+        Returns:
+            list: Result records (fully fetched)
+        """
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters,
+            database_=self.db_name,
+            routing_=RoutingControl.READ
+        )
+        return records
+
+    def _ensure_indexes(self):
+        """
+        Create the indexes used by title lookups, if they don't exist yet.
+
+        Failures (e.g. a read-only user) are reported but not fatal, since the
+        queries still work without the index.
+        """
+        for statement in INDEX_STATEMENTS:
+            try:
+                self.driver.execute_query(statement, database_=self.db_name)
+            except Exception as e:
+                print(f"Could not create index ({e}); continuing without it")
+
+    def _warm_up(self):
+        """
+        Run each per-request query once with harmless parameters.
+
+        This makes Neo4j plan and cache them at startup rather than on the
+        first user request.
+        """
+        try:
+            self.get_source_movie(-1)
+            self._get_movie_titles([-1])
+            self._read(RECOMMENDATION_QUERY, userId=-1, sourceId=-1, candidates=[-1], n=1)
+            self._read(EXPLANATION_PATHS_QUERY, source_id=-1, targets=[{'title': '', 'movieId': -1}])
+            self._read(FUZZY_SEARCH_QUERY, query='warmup~', limit=1)
+        except Exception as e:
+            print(f"Query warm-up failed ({e}); plans will be compiled on first use")
+
+    def _load_movie_index(self):
+        """
+        Load every movie's ID and title from Neo4j.
+
+        Returns:
+            tuple: ({title: movieId}, {movieId: title})
+        """
+        query = """
+        MATCH (m:Movie)
+        WHERE m.title IS NOT NULL
+        RETURN m.movieId AS movieId, m.title AS title
+        """
+        id_to_title = {record['movieId']: record['title'] for record in self._read(query)}
+
+        title_to_id = {title: movie_id for movie_id, title in id_to_title.items()}
+        print(f"Loaded title index with {len(title_to_id)} movies")
+        return title_to_id, id_to_title
+
+    def _load_user_seeds(self):
+        """
+        Find the most recent 5-star rated movie of every user in one query.
+
+        Returns:
+            dict: userId -> movieId
+        """
+        query = """
+        MATCH (u:User)-[r:RATED {rating: 5.0}]->(m:Movie)
+        WITH u, m ORDER BY r.timestamp DESC
+        WITH u, collect(m)[0] AS top
+        RETURN u.userId AS userId, top.movieId AS movieId
+        """
+        return {record['userId']: record['movieId'] for record in self._read(query)}
+
+    def _get_user_seeds(self):
+        """
+        Get the user -> seed movie map, rebuilding it once it is USER_SEED_TTL old.
+
+        Returns:
+            dict: userId -> movieId
+        """
+        with self._user_seed_lock:
+            if time.monotonic() - self._user_seed_loaded_at >= USER_SEED_TTL:
+                self._user_seed = self._load_user_seeds()
+                self._user_seed_loaded_at = time.monotonic()
+            return self._user_seed
+
+    def get_movie_id(self, title):
         """
-        Convert a movieId to the node identifier used in the embeddings.
+        Get the ID of a movie by its exact title.
 
         Args:
-            movie_id (int): The movieId from the database
+            title (str): Exact movie title
 
         Returns:
-            str: The node identifier (e.g., 'movie_123')
+            int: Movie ID or None if not found
         """
-        return f"movie_{movie_id}"
+        return self._title_to_id.get(title)
 
-    def _parse_node_id(self, node_id):
+    def _similar_movies(self, source_movie_id, topn, exclude_ids=()):
         """
-        Parse a node identifier to extract type and ID.
+        Rank movies by cosine similarity to a movie's embedding.
+
+        Scores every movie with one matrix-vector product over the
+        pre-normalized embeddings, masks out excluded IDs, and selects the best
+        topn with argpartition, so no per-candidate Python work is needed.
 
         Args:
-            node_id (str): Node identifier (e.g., 'movie_123', 'actor_Tom Hanks')
+            source_movie_id (int): ID of the source movie; must have an embedding
+            topn (int): Maximum number of movies to return
+            exclude_ids (set): Movie IDs that must not be returned
 
         Returns:
-            tuple: (node_type, node_value)
+            list: (movie_id, similarity) tuples, most similar first
         """
-        if '_' in node_id:
-            parts = node_id.split('_', 1)
-            return parts[0], parts[1]
-        return 'unknown', node_id
+        source = self._movie_unit[self._movie_row[source_movie_id]]
+        scores = self._movie_unit @ source
+
+        if exclude_ids:
+            excluded = np.isin(self._movie_ids_sorted, np.fromiter(exclude_ids, dtype=np.int64))
+            scores[excluded] = -np.inf
+
+        topn = min(topn, len(scores))
+        if topn <= 0:
+            return []
+
+        top = np.argpartition(-scores, topn - 1)[:topn]
+        top = top[np.argsort(-scores[top])]
+        top = top[np.isfinite(scores[top])]
+
+        return list(zip(self._movie_ids_sorted[top].tolist(), scores[top].tolist()))
 
     def get_source_movie(self, user_id):
         """
@@ -89,22 +341,28 @@ class XAIRecommender:
         Returns:
             dict: Movie information {'movieId': int, 'title': str} or None
         """
-        with self.driver.session() as session:
-            query = """
-            MATCH (u:User {userId: $userId})-[r:RATED {rating: 5.0}]->(m:Movie)
-            RETURN m.title AS title, m.movieId AS movieId, r.timestamp AS timestamp
-            ORDER BY r.timestamp DESC
-            LIMIT 1
-            """
-            result = session.run(query, {'userId': user_id})
-            record = result.single()
+        movie_id = self._get_user_seeds().get(user_id)
+        if movie_id is not None and movie_id in self._id_to_title:
+            return {
+                'movieId': movie_id,
+                'title': self._id_to_title[movie_id]
+            }
 
-            if record:
-                return {
-                    'movieId': record['movieId'],
-                    'title': record['title']
-                }
-            return None
+        # Not in the precomputed map (e.g. rated since it was built): ask Neo4j
+        query = """
+        MATCH (u:User {userId: $userId})-[r:RATED {rating: 5.0}]->(m:Movie)
+        RETURN m.title AS title, m.movieId AS movieId, r.timestamp AS timestamp
+        ORDER BY r.timestamp DESC
+        LIMIT 1
+        """
+        records = self._read(query, userId=user_id)
+
+        if records:
+            return {
+                'movieId': records[0]['movieId'],
+                'title': records[0]['title']
+            }
+        return None
 
     def get_user_rated_movies(self, user_id):
         """
@@ -114,15 +372,15 @@ class XAIRecommender:
             user_id (int): The user ID
 
         Returns:
-            set: Set of movieIds that the user has rated
+            frozenset: movieIds that the user has rated
         """
-        with self.driver.session() as session:
-            query = """
-            MATCH (u:User {userId: $userId})-[:RATED]->(m:Movie)
-            RETURN m.movieId AS movieId
-            """
-            result = session.run(query, {'userId': user_id})
-            return {record['movieId'] for record in result}
+        # Aggregated in Cypher so the IDs arrive as one list, not one record each
+        query = """
+        MATCH (u:User {userId: $userId})-[:RATED]->(m:Movie)
+        RETURN collect(m.movieId) AS ids
+        """
+        records = self._read(query, userId=user_id)
+        return frozenset(records[0]['ids'] if records else ())
 
     def get_movie_title(self, movie_id):
         """
@@ -134,14 +392,68 @@ class XAIRecommender:
         Returns:
             str: Movie title or None if not found
         """
-        with self.driver.session() as session:
+        return self._get_movie_titles([movie_id]).get(movie_id)
+
+    def _get_movie_titles(self, movie_ids):
+        """
+        Get the titles of several movies at once.
+
+        IDs are resolved from the in-memory index; any not found there (e.g.
+        movies added after startup) are fetched together in one query.
+
+        Args:
+            movie_ids (list): Movie IDs
+
+        Returns:
+            dict: movieId -> title for every ID that exists
+        """
+        titles = {}
+        missing = []
+
+        for movie_id in movie_ids:
+            title = self._id_to_title.get(movie_id)
+            if title:
+                titles[movie_id] = title
+            else:
+                missing.append(movie_id)
+
+        if missing:
             query = """
-            MATCH (m:Movie {movieId: $movieId})
-            RETURN m.title AS title
+            UNWIND $ids AS id
+            MATCH (m:Movie {movieId: id})
+            RETURN m.movieId AS movieId, m.title AS title
             """
-            result = session.run(query, {'movieId': movie_id})
-            record = result.single()
-            return record['title'] if record else None
+            records = self._read(query, ids=missing)
+            found = {record['movieId']: record['title'] for record in records if record['title']}
+
+            titles.update(found)
+            if found:
+                self._remember_titles(found)
+
+        return titles
+
+    def _remember_titles(self, found):
+        """
+        Add titles found on a miss to the in-memory index.
+
+        The title dicts and search index are updated together, so the next
+        get_movie_id or search_movies call sees the new movies as well.
+
+        Args:
+            found (dict): movieId -> title of movies missing from the index
+        """
+        with self._movie_index_lock:
+            new = {movie_id: title for movie_id, title in found.items() if movie_id not in self._id_to_title}
+            if not new:
+                return
+
+            search_index = list(self._search_index)
+            for movie_id, title in new.items():
+                bisect.insort(search_index, (title.lower(), movie_id, title))
+
+            self._id_to_title = {**self._id_to_title, **new}
+            self._title_to_id = {**self._title_to_id, **{title: movie_id for movie_id, title in new.items()}}
+            self._search_index = search_index
 
     def get_recommendations(self, user_id, n=5):
         """
@@ -155,7 +467,7 @@ class XAIRecommender:
             dict: {
                 'source_movie': str,
                 'recommendations': [
-                    {'movieId': int, 'title': str, 'similarity': float},
+                    {'movieId': int, 'title': str, 'similarity': float, 'explanation': str},
                     ...
                 ]
             }
@@ -172,69 +484,121 @@ class XAIRecommender:
 
         source_movie_id = source_movie['movieId']
         source_title = source_movie['title']
-        source_node_id = self._get_movie_node_id(source_movie_id)
 
         # Step 2: Check if source movie exists in embeddings
-        if source_node_id not in self.wv:
+        if source_movie_id not in self._movie_row:
             return {
                 'source_movie': source_title,
                 'recommendations': [],
                 'message': f"Movie '{source_title}' not found in trained model"
             }
 
-        # Step 3: Get movies the user has already rated (to filter them out)
-        rated_movies = self.get_user_rated_movies(user_id)
+        cache_key = (user_id, source_movie_id, n)
+        cached = self._get_cached_recommendations(cache_key)
+        if cached is not None:
+            return cached
 
-        # Step 4: Find similar movies using Node2Vec embeddings
-        # Request more than needed to allow for filtering
-        try:
-            similar_nodes = self.wv.most_similar(source_node_id, topn=n + 50)
-        except KeyError:
+        # Step 3: Find similar movies using Node2Vec embeddings, excluding the source
+        # Request more than needed to allow for filtering out rated movies
+        candidates = self._similar_movies(source_movie_id, n + 50, exclude_ids={source_movie_id})
+
+        if not candidates:
             return {
                 'source_movie': source_title,
-                'recommendations': [],
-                'message': f"Could not find similar movies for '{source_title}'"
+                'source_movie_id': source_movie_id,
+                'recommendations': []
             }
 
-        # Step 5: Filter and process recommendations
-        recommendations = []
-
-        for node_id, similarity in similar_nodes:
-            # Parse node ID to check if it's a movie
-            node_type, node_value = self._parse_node_id(node_id)
-
-            if node_type != 'movie':
-                continue  # Skip non-movie nodes
+        # Step 4: In one round-trip, drop candidates the user has already rated
+        # (or that aren't in the database), keep the best n, and fetch their
+        # titles plus a path from the source movie to explain each one
+        records = self._read(
+            RECOMMENDATION_QUERY,
+            userId=user_id,
+            sourceId=source_movie_id,
+            candidates=[movie_id for movie_id, _ in candidates],
+            n=n
+        )
+        rows = {record['movieId']: record for record in records}
 
-            try:
-                movie_id = int(node_value)
-            except ValueError:
-                continue  # Skip if movie ID is not a valid integer
+        recommendations = []
+        explanations = {}
 
-            # Skip if it's the source movie or already rated by user
-            if movie_id == source_movie_id or movie_id in rated_movies:
-                continue
+        for movie_id, similarity in candidates:
+            record = rows.get(movie_id)
+            if record is None or not record['title']:
+                continue  # Rated by the user, past the top n, or not in the database
 
-            # Get movie title
-            title = self.get_movie_title(movie_id)
-            if not title:
-                continue  # Skip if movie not found in database
+            explanation = self._explain_path(record['path'])
+            explanations[record['title']] = explanation
 
             recommendations.append({
                 'movieId': movie_id,
-                'title': title,
-                'similarity': float(similarity)
+                'title': record['title'],
+                'similarity': float(similarity),
+                'explanation': explanation
             })
 
-            # Stop when we have enough recommendations
-            if len(recommendations) >= n:
-                break
+        self._remember_explanations(source_title, explanations)
 
-        return {
+        result = {
             'source_movie': source_title,
             'source_movie_id': source_movie_id,
             'recommendations': recommendations
         }
+        self._remember_recommendations(cache_key, result)
+        return self._copy_recommendations(result)
+
+    def _get_cached_recommendations(self, cache_key):
+        """
+        Look up a recommendation response that is still within its TTL.
+
+        Args:
+            cache_key (tuple): (userId, source movieId, n)
+
+        Returns:
+            dict: A copy of the cached response, or None on a miss
+        """
+        with self._recommendations_lock:
+            entry = self._recommendations.get(cache_key)
+            if entry is None:
+                return None
+
+            cached_at, result = entry
+            if time.monotonic() - cached_at >= RECOMMENDATION_CACHE_TTL:
+                del self._recommendations[cache_key]
+                return None
+
+            self._recommendations.move_to_end(cache_key)
+
+        return self._copy_recommendations(result)
+
+    def _remember_recommendations(self, cache_key, result):
+        """
+        Add a recommendation response to the in-memory LRU cache, evicting the oldest.
+
+        Args:
+            cache_key (tuple): (userId, source movieId, n)
+            result (dict): Response returned by get_recommendations
+        """
+        with self._recommendations_lock:
+            self._recommendations[cache_key] = (time.monotonic(), result)
+
+            while len(self._recommendations) > RECOMMENDATION_CACHE_SIZE:
+                self._recommendations.popitem(last=False)
+
+    @staticmethod
+    def _copy_recommendations(result):
+        """
+        Copy a recommendation response so callers can't modify the cached one.
+
+        Args:
+            result (dict): Response returned by get_recommendations
+
+        Returns:
+            dict: Copy of the response and of each recommendation
+        """
+        return {**result, 'recommendations': [dict(rec) for rec in result['recommendations']]}
 
     def get_explanation(self, source_movie_title, recommended_movie_title):
         """
@@ -250,57 +614,115 @@ class XAIRecommender:
         Returns:
             str: Human-readable explanation
         """
-        with self.driver.session() as session:
-            # Query to find a short path between the two movies
-            # We limit to path length 2 (e.g., Movie-Actor-Movie) for relevance
-            query = """
-            MATCH path = (m1:Movie {title: $source_title})-[*1..2]-(m2:Movie {title: $recommended_title})
-            RETURN path
-            LIMIT 1
-            """
+        return self.get_explanations_bulk(source_movie_title, [recommended_movie_title])[recommended_movie_title]
 
-            result = session.run(query, {
-                'source_title': source_movie_title,
-                'recommended_title': recommended_movie_title
-            })
+    def get_explanations_bulk(self, source_movie_title, recommended_movie_titles):
+        """
+        Generate explanations for several recommendations of one source movie.
 
-            record = result.single()
+        Pairs seen before are answered from the in-memory cache; the rest are
+        looked up together in a single Cypher query.
 
-            if not record:
-                # No direct path found - return generic explanation
-                return "it has similar characteristics to movies you've enjoyed"
+        Args:
+            source_movie_title (str): Title of the source movie
+            recommended_movie_titles (list): Titles of the recommended movies
 
-            # Parse the path to create explanation
-            path = record['path']
-            nodes = path.nodes
-            relationships = path.relationships
+        Returns:
+            dict: Recommended movie title -> human-readable explanation
+        """
+        explanations = {}
+        missing = []
+
+        with self._explanations_lock:
+            for title in recommended_movie_titles:
+                key = (source_movie_title, title)
+                if key in self._explanations:
+                    self._explanations.move_to_end(key)
+                    explanations[title] = self._explanations[key]
+                else:
+                    missing.append(title)
+
+        if not missing:
+            return explanations
+
+        source_id = self.get_movie_id(source_movie_title)
+        targets = [
+            {'title': title, 'movieId': self.get_movie_id(title)}
+            for title in missing
+            if self.get_movie_id(title) is not None
+        ]
+
+        paths = {}
+        if source_id is not None and targets:
+            # Find a short path from the source to each target in one round-trip
+            records = self._read(EXPLANATION_PATHS_QUERY, source_id=source_id, targets=targets)
+            paths = {record['title']: record['path'] for record in records}
+
+        new_explanations = {title: self._explain_path(paths.get(title)) for title in missing}
+        self._remember_explanations(source_movie_title, new_explanations)
+        explanations.update(new_explanations)
+
+        return explanations
+
+    def _remember_explanations(self, source_movie_title, explanations):
+        """
+        Add explanations to the in-memory LRU cache, evicting the oldest pairs.
 
-            # If path has 3 nodes (source-intermediate-target)
-            if len(nodes) == 3:
-                intermediate_node = nodes[1]
-                labels = list(intermediate_node.labels)
+        Args:
+            source_movie_title (str): Title of the source movie
+            explanations (dict): Recommended movie title -> explanation
+        """
+        with self._explanations_lock:
+            for title, explanation in explanations.items():
+                self._explanations[(source_movie_title, title)] = explanation
 
-                if 'Actor' in labels:
-                    actor_name = intermediate_node.get('name', 'an actor')
-                    return f"it also features **{actor_name}**"
+            while len(self._explanations) > EXPLANATION_CACHE_SIZE:
+                self._explanations.popitem(last=False)
 
-                elif 'Director' in labels:
-                    director_name = intermediate_node.get('name', 'a director')
-                    return f"it was also directed by **{director_name}**"
+    def _explain_path(self, path):
+        """
+        Turn a knowledge graph path between two movies into an explanation.
 
-                elif 'Genre' in labels:
-                    genre_name = intermediate_node.get('name', 'a genre')
-                    return f"it shares the **{genre_name}** genre"
+        Args:
+            path (neo4j.graph.Path): Path from the source to the recommended movie, or None
 
-            # If path has 2 nodes (direct connection, though unlikely for movies)
-            elif len(nodes) == 2 and relationships:
-                rel_type = relationships[0].type
+        Returns:
+            str: Human-readable explanation
+        """
+        if path is None:
+            # No direct path found - return generic explanation
+            return "it has similar characteristics to movies you've enjoyed"
+
+        # Parse the path to create explanation
+        nodes = path.nodes
+        relationships = path.relationships
+
+        # If path has 3 nodes (source-intermediate-target)
+        if len(nodes) == 3:
+            intermediate_node = nodes[1]
+            labels = list(intermediate_node.labels)
+
+            if 'Actor' in labels:
+                actor_name = intermediate_node.get('name', 'an actor')
+                return f"it also features **{actor_name}**"
 
-                if rel_type == 'HAS_GENRE':
-                    return "it shares similar genres"
+            elif 'Director' in labels:
+                director_name = intermediate_node.get('name', 'a director')
+                return f"it was also directed by **{director_name}**"
 
-            # Fallback explanation
-            return "it has similar characteristics based on the knowledge graph"
+            elif 'Genre' in labels:
+                genre_name = intermediate_node.get('name', 'a genre')
+                return f"it shares the **{genre_name}** genre"
+
+        # If path has 2 nodes (direct connection, though unlikely for movies)
+        elif len(nodes) == 2 and relationships:
+            rel_type = relationships[0].type
+
+            if rel_type == 'HAS_GENRE':
+                return "it shares similar genres"
+
+        # Fallback explanation
+        return "it has similar characteristics based on the knowledge graph"
 
     def explain_recommendation(self, user_id, recommended_movie_title):
         """
@@ -334,7 +756,12 @@ class XAIRecommender:
 
     def search_movies(self, query, limit=10):
         """
-        Search for movies by title (supports fuzzy matching).
+        Search for movies by title (substring match, then fuzzy match).
+
+        Substring matches come from the in-memory title index, so most
+        autocomplete-style searches never reach Neo4j. Only when there are no
+        substring matches at all (e.g. a misspelled title) is the full-text
+        index queried for fuzzy matches.
 
         Args:
             query (str): Search query (partial movie title)
@@ -343,24 +770,54 @@ class XAIRecommender:
         Returns:
             list: List of matching movies [{'movieId': int, 'title': str}, ...]
         """
-        with self.driver.session() as session:
-            # Case-insensitive search using CONTAINS
-            cypher_query = """
-            MATCH (m:Movie)
-            WHERE toLower(m.title) CONTAINS toLower($query)
-            RETURN m.movieId AS movieId, m.title AS title
-            LIMIT $limit
-            """
-            result = session.run(cypher_query, {'query': query, 'limit': limit})
+        needle = query.lower()
+        matches = (
+            {'movieId': movie_id, 'title': title}
+            for lowered, movie_id, title in self._search_index
+            if needle in lowered
+        )
+        results = list(islice(matches, limit))
+        if results:
+            return results
+
+        try:
+            fuzzy = self._fuzzy_search(query.strip(), limit)
+        except Exception as e:
+            print(f"Full-text search failed ({e}); no matches found")
+            return []
+
+        return [dict(movie) for movie in fuzzy]
+
+    def _query_fulltext(self, query, limit):
+        """
+        Fuzzy-match titles against the movieTitleFulltext index.
 
-            movies = []
-            for record in result:
-                movies.append({
-                    'movieId': record['movieId'],
-                    'title': record['title']
-                })
+        Each term is escaped and given Lucene's '~' fuzzy operator, so small
+        misspellings still match. Results are memoized by _fuzzy_search.
+
+        Args:
+            query (str): Search query
+            limit (int): Maximum number of results to return
+
+        Returns:
+            tuple: Matching movies ({'movieId': int, 'title': str}, ...)
+        """
+        terms = [LUCENE_SPECIAL_CHARS.sub(r'\\\1', term) for term in query.split()]
+        if not terms:
+            return ()
 
-            return movies
+        lucene_query = ' '.join(f'{term}~' for term in terms)
+        records = self._read(FUZZY_SEARCH_QUERY, query=lucene_query, limit=limit)
+        return tuple({'movieId': r['movieId'], 'title': r['title']} for r in records)
+
+    def get_all_movie_titles(self):
+        """
+        Get every movie title in the database, sorted alphabetically.
+
+        Returns:
+            list: Sorted list of movie titles
+        """
+        return sorted(self._title_to_id)
 
     def get_movie_by_title(self, title):
         """
@@ -372,20 +829,14 @@ class XAIRecommender:
         Returns:
             dict: Movie information {'movieId': int, 'title': str} or None
         """
-        with self.driver.session() as session:
-            query = """
-            MATCH (m:Movie {title: $title})
-            RETURN m.movieId AS movieId, m.title AS title
-            """
-            result = session.run(query, {'title': title})
-            record = result.single()
+        movie_id = self.get_movie_id(title)
 
-            if record:
-                return {
-                    'movieId': record['movieId'],
-                    'title': record['title']
-                }
-            return None
+        if movie_id is not None:
+            return {
+                'movieId': movie_id,
+                'title': title
+            }
+        return None
 
     def get_recommendations_by_movie(self, movie_title, n=5):
         """
@@ -417,10 +868,9 @@ class XAIRecommender:
 
         source_movie_id = source_movie['movieId']
         source_title = source_movie['title']
-        source_node_id = self._get_movie_node_id(source_movie_id)
 
         # Step 2: Check if source movie exists in embeddings
-        if source_node_id not in self.wv:
+        if source_movie_id not in self._movie_row:
             return {
                 'source_movie': source_title,
                 'source_movie_id': source_movie_id,
@@ -428,38 +878,15 @@ class XAIRecommender:
                 'message': f"Movie '{source_title}' not found in trained model"
             }
 
-        # Step 3: Find similar movies using Node2Vec embeddings
-        try:
-            similar_nodes = self.wv.most_similar(source_node_id, topn=n + 20)
-        except KeyError:
-            return {
-                'source_movie': source_title,
-                'source_movie_id': source_movie_id,
-                'recommendations': [],
-                'message': f"Could not find similar movies for '{source_title}'"
-            }
+        # Step 3: Find similar movies using Node2Vec embeddings, excluding the source
+        candidates = self._similar_movies(source_movie_id, n + 20, exclude_ids={source_movie_id})
 
-        # Step 4: Filter and process recommendations
+        # Step 4: Look up all candidate titles at once
+        titles = self._get_movie_titles([movie_id for movie_id, _ in candidates])
         recommendations = []
 
-        for node_id, similarity in similar_nodes:
-            # Parse node ID to check if it's a movie
-            node_type, node_value = self._parse_node_id(node_id)
-
-            if node_type != 'movie':
-                continue  # Skip non-movie nodes
-
-            try:
-                movie_id = int(node_value)
-            except ValueError:
-                continue  # Skip if movie ID is not a valid integer
-
-            # Skip if it's the source movie
-            if movie_id == source_movie_id:
-                continue
-
-            # Get movie title
-            title = self.get_movie_title(movie_id)
+        for movie_id, similarity in candidates:
+            title = titles.get(movie_id)
             if not title:
                 continue  # Skip if movie not found in database
 
@@ -495,14 +922,11 @@ if __name__ == "__main__":
         print(f"\nBased on your love for: {result['source_movie']}")
         print("\nRecommended movies:")
 
+        # Explanations come back with the recommendations (same query)
         for i, rec in enumerate(result['recommendations'], 1):
-            explanation = recommender.get_explanation(
-                result['source_movie'],
-                rec['title']
-            )
             print(f"\n{i}. {rec['title']}")
             print(f"   Similarity: {rec['similarity']:.4f}")
-            print(f"   Why? Because {explanation}")
+            print(f"   Why? Because {rec['explanation']}")
 
     finally:
         # Close connection
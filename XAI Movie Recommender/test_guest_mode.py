@@ -59,11 +59,14 @@ def test_guest_mode():
                 print(f"\n   Because you like: {recommendations['source_movie']}")
                 print("   You might also enjoy:")
 
+                # One query explains every recommendation
+                explanations = recommender.get_explanations_bulk(
+                    recommendations['source_movie'],
+                    [rec['title'] for rec in recommendations['recommendations']]
+                )
+
                 for i, rec in enumerate(recommendations['recommendations'], 1):
-                    explanation = recommender.get_explanation(
-                        recommendations['source_movie'],
-                        rec['title']
-                    )
+                    explanation = explanations[rec['title']]
                     print(f"\n   {i}. {rec['title']}")
                     print(f"      Similarity: {rec['similarity']:.4f}")
                     print(f"      Why? Because {explanation}")
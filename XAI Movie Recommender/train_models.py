@@ -14,89 +14,189 @@ Prerequisites:
 """
 
 import os
-import networkx as nx
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 from neo4j import GraphDatabase
-from node2vec import Node2Vec
+from gensim.models import Word2Vec
+from pecanpy.pecanpy import FirstOrderUnweighted, SparseOTF
 from dotenv import load_dotenv
 from tqdm import tqdm
 
 
-def fetch_graph_from_neo4j(driver):
+# Number of partitions the edge export is split into, each fetched over its own session
+EXPORT_WORKERS = 8
+
+# Every relationship whose start node falls in one partition, with node
+# identifiers (movie IDs for movies and names for other node types)
+EDGE_QUERY = """
+MATCH (n)-[r]->(m)
+WHERE id(n) % $partitions = $partition
+RETURN
+    CASE
+        WHEN 'Movie' IN labels(n) THEN 'movie_' + toString(n.movieId)
+        WHEN 'User' IN labels(n) THEN 'user_' + toString(n.userId)
+        WHEN 'Genre' IN labels(n) THEN 'genre_' + n.name
+        WHEN 'Director' IN labels(n) THEN 'director_' + n.name
+        WHEN 'Actor' IN labels(n) THEN 'actor_' + n.name
+        ELSE 'unknown_' + toString(id(n))
+    END AS source,
+    CASE
+        WHEN 'Movie' IN labels(m) THEN 'movie_' + toString(m.movieId)
+        WHEN 'User' IN labels(m) THEN 'user_' + toString(m.userId)
+        WHEN 'Genre' IN labels(m) THEN 'genre_' + m.name
+        WHEN 'Director' IN labels(m) THEN 'director_' + m.name
+        WHEN 'Actor' IN labels(m) THEN 'actor_' + m.name
+        ELSE 'unknown_' + toString(id(m))
+    END AS target
+"""
+
+
+def fetch_partition(driver, partition, partitions):
     """
-    Fetch the entire graph from Neo4j and convert it to a NetworkX graph.
-    Uses node identifiers (movieId for movies, names for others) as node keys.
+    Fetch the edges whose start node falls in one partition of the graph.
 
     Args:
         driver: Neo4j driver instance
+        partition (int): Index of the partition to fetch
+        partitions (int): Total number of partitions
 
     Returns:
-        networkx.Graph: A NetworkX graph representation of the knowledge graph
+        tuple: (src, dst, node_ids) where src and dst are np.ndarray edge
+            endpoints indexing into this partition's own node_ids list
     """
-    print("Fetching graph data from Neo4j...")
-
-    # Create an empty undirected graph
-    G = nx.Graph()
+    node_id_to_int = {}
 
     with driver.session() as session:
-        # Query to get all relationships with node identifiers
-        # We use movie IDs for movies and names for other node types
-        query = """
-        MATCH (n)-[r]->(m)
-        RETURN
-            CASE
-                WHEN 'Movie' IN labels(n) THEN 'movie_' + toString(n.movieId)
-                WHEN 'User' IN labels(n) THEN 'user_' + toString(n.userId)
-                WHEN 'Genre' IN labels(n) THEN 'genre_' + n.name
-                WHEN 'Director' IN labels(n) THEN 'director_' + n.name
-                WHEN 'Actor' IN labels(n) THEN 'actor_' + n.name
-                ELSE 'unknown_' + toString(id(n))
-            END AS source,
-            CASE
-                WHEN 'Movie' IN labels(m) THEN 'movie_' + toString(m.movieId)
-                WHEN 'User' IN labels(m) THEN 'user_' + toString(m.userId)
-                WHEN 'Genre' IN labels(m) THEN 'genre_' + m.name
-                WHEN 'Director' IN labels(m) THEN 'director_' + m.name
-                WHEN 'Actor' IN labels(m) THEN 'actor_' + m.name
-                ELSE 'unknown_' + toString(id(m))
-            END AS target,
-            type(r) AS relationship
-        """
-
-        result = session.run(query)
-
-        # Add edges to the NetworkX graph
-        edge_count = 0
-        for record in tqdm(result, desc="Loading edges"):
-            source = record['source']
-            target = record['target']
-            rel_type = record['relationship']
-
-            # Add edge with relationship type as attribute
-            G.add_edge(source, target, relationship=rel_type)
-            edge_count += 1
-
-        print(f"Graph loaded: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
-
-    return G
-
-
-def train_node2vec_model(graph, dimensions=64, walk_length=30, num_walks=200, workers=4):
+        result = session.run(EDGE_QUERY, partition=partition, partitions=partitions)
+
+        # Number both endpoints of every record as they stream in, filling a
+        # single interleaved array in one pass
+        endpoints = np.fromiter(
+            (
+                node_id_to_int.setdefault(node_id, len(node_id_to_int))
+                for record in result
+                for node_id in record
+            ),
+            dtype=np.int64,
+        )
+
+    return endpoints[0::2], endpoints[1::2], list(node_id_to_int)
+
+
+def fetch_graph_from_neo4j(driver, workers=EXPORT_WORKERS):
+    """
+    Fetch every edge of the graph from Neo4j as two parallel integer arrays.
+    Uses node identifiers (movieId for movies, names for others) as node keys,
+    each mapped to a dense integer index.
+
+    The export is split by start node ID into one partition per worker, each
+    streamed over its own session, so Neo4j serializes partitions in parallel.
+
+    Args:
+        driver: Neo4j driver instance
+        workers (int): Number of partitions fetched concurrently
+
+    Returns:
+        tuple: (src, dst, node_ids) where src and dst are np.ndarray edge
+            endpoints and node_ids lists the node identifier of each index
+    """
+    print(f"Fetching graph data from Neo4j ({workers} partitions)...")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(fetch_partition, driver, partition, workers)
+            for partition in range(workers)
+        ]
+        for _ in tqdm(as_completed(futures), total=workers, desc="Loading edges"):
+            pass
+        partitions = [future.result() for future in futures]
+
+    # Remap each partition's local node indices onto one global numbering
+    node_id_to_int = {}
+    src_parts, dst_parts = [], []
+    for src, dst, local_ids in partitions:
+        lookup = np.fromiter(
+            (node_id_to_int.setdefault(node_id, len(node_id_to_int)) for node_id in local_ids),
+            dtype=np.int64,
+            count=len(local_ids),
+        )
+        src_parts.append(lookup[src])
+        dst_parts.append(lookup[dst])
+
+    src = np.concatenate(src_parts)
+    dst = np.concatenate(dst_parts)
+    node_ids = list(node_id_to_int)
+    print(f"Graph loaded: {len(node_ids)} nodes, {len(src)} edges")
+
+    return src, dst, node_ids
+
+
+def build_csr_graph(src, dst, node_ids, output_path='models/graph.npz'):
+    """
+    Build an undirected, unweighted CSR adjacency matrix from edge arrays and
+    save it in the .npz layout pecanpy reads.
+
+    Each edge is stored in both directions; duplicate edges between the same
+    pair of nodes (e.g. a person who both acted in and directed a movie) are
+    collapsed into one.
+
+    Args:
+        src (np.ndarray): Source node index of each edge
+        dst (np.ndarray): Target node index of each edge
+        node_ids (list): Node identifier of each index
+        output_path (str): Path to save the CSR graph
+
+    Returns:
+        str: Path of the saved graph
+    """
+    num_nodes = len(node_ids)
+
+    # Symmetrize, then dedupe (row, col) pairs via a single int64 key, which
+    # also sorts the edges by row and column
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src])
+    keys = np.unique(rows * num_nodes + cols)
+    rows, cols = np.divmod(keys, num_nodes)
+
+    indptr = np.zeros(num_nodes + 1, dtype=np.uint32)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    np.savez(
+        output_path,
+        data=np.ones(len(cols), dtype=np.float32),
+        indptr=indptr,
+        indices=cols.astype(np.uint32),
+        IDs=np.asarray(node_ids),
+    )
+    print(f"CSR graph saved to: {output_path}")
+
+    return output_path
+
+
+def train_node2vec_model(graph_path, dimensions=64, walk_length=30, num_walks=200, p=1, q=1, workers=None):
     """
     Train a Node2Vec model on the given graph.
 
     Node2Vec learns vector representations of nodes by performing random walks
-    on the graph and then applying Word2Vec-style learning.
+    on the graph and then applying Word2Vec-style learning. Walks are generated
+    by pecanpy, whose numba-compiled samplers work directly on the CSR arrays
+    and run in parallel across all cores.
 
     Args:
-        graph: NetworkX graph
+        graph_path (str): Path to the CSR graph saved by build_csr_graph
         dimensions (int): Embedding dimensions (default: 64)
         walk_length (int): Length of each random walk (default: 30)
         num_walks (int): Number of walks per node (default: 200)
-        workers (int): Number of parallel workers (default: 4)
+        p (float): Return parameter (default: 1)
+        q (float): In-out parameter (default: 1)
+        workers (int): Number of parallel workers (default: all CPU cores)
 
     Returns:
-        node2vec.Node2Vec: Trained Node2Vec model
+        gensim.models.Word2Vec: Trained Node2Vec model
     """
+    workers = workers or os.cpu_count()
+
     print("\nInitializing Node2Vec model...")
     print(f"  Dimensions: {dimensions}")
     print(f"  Walk length: {walk_length}")
@@ -107,15 +207,17 @@ def train_node2vec_model(graph, dimensions=64, walk_length=30, num_walks=200, wo
     # p and q parameters control the random walk strategy:
     # - p: return parameter (likelihood of returning to previous node)
     # - q: in-out parameter (likelihood of exploring vs. staying local)
-    # Default values (p=1, q=1) give unbiased random walks
-    node2vec = Node2Vec(
-        graph,
-        dimensions=dimensions,
-        walk_length=walk_length,
-        num_walks=num_walks,
-        workers=workers,
-        quiet=False
-    )
+    # Default values (p=1, q=1) give unbiased random walks, which don't depend on
+    # the previous step, so the cheaper first-order sampler is used for them
+    if p == 1 and q == 1:
+        node2vec = FirstOrderUnweighted(p=p, q=q, workers=workers, verbose=True)
+    else:
+        node2vec = SparseOTF(p=p, q=q, workers=workers, verbose=True)
+    node2vec.read_npz(graph_path, weighted=False)
+    node2vec.preprocess_transition_probs()
+
+    print("\nGenerating random walks...")
+    walks = node2vec.simulate_walks(num_walks=num_walks, walk_length=walk_length)
 
     print("\nTraining Node2Vec model...")
     print("This may take several minutes depending on graph size...")
@@ -123,11 +225,16 @@ def train_node2vec_model(graph, dimensions=64, walk_length=30, num_walks=200, wo
     # Train the model using Word2Vec
     # window: maximum distance between current and predicted node in a walk
     # min_count: ignores all nodes with total frequency lower than this
-    # batch_words: number of nodes to process in each batch
-    model = node2vec.fit(
+    # sg: skip-gram, as in the original Node2Vec
+    # batch_words is left at gensim's default; tiny batches keep worker threads
+    # waiting on the job queue instead of training
+    model = Word2Vec(
+        walks,
+        vector_size=dimensions,
         window=10,
         min_count=1,
-        batch_words=4
+        sg=1,
+        workers=workers
     )
 
     print("Model training complete!")
@@ -226,19 +333,19 @@ def main():
 
     try:
         # Step 1: Fetch graph from Neo4j
-        graph = fetch_graph_from_neo4j(driver)
+        src, dst, node_ids = fetch_graph_from_neo4j(driver)
 
-        if graph.number_of_nodes() == 0:
+        if not node_ids:
             print("ERROR: Graph is empty. Please run load_graph.py first.")
             return
 
         # Step 2: Train Node2Vec model
+        graph_path = build_csr_graph(src, dst, node_ids, 'models/graph.npz')
         model = train_node2vec_model(
-            graph,
+            graph_path,
             dimensions=64,
             walk_length=30,
-            num_walks=200,
-            workers=4
+            num_walks=200
         )
 
         # Step 3: Save the model
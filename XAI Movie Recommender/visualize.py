@@ -13,15 +13,82 @@ Usage:
 """
 
 import os
-import networkx as nx
-import plotly.graph_objects as go
-import plotly.express as px
-from neo4j import GraphDatabase
+from functools import lru_cache
+from neo4j import GraphDatabase, READ_ACCESS
 from dotenv import load_dotenv
-from sklearn.decomposition import PCA
 import numpy as np
-from gensim.models import KeyedVectors
-import pandas as pd
+
+# plotly, scikit-learn, gensim and pandas are imported inside the methods that
+# need them, so callers that only query graphs don't pay for loading them
+
+
+# Indexes behind the Movie.title and User.userId lookups every query here
+# starts from. load_graph.py and recommender.py declare the same title index
+# as movie_title_idx, so whichever process runs first, only one index exists;
+# the statements are repeated rather than imported so that this module doesn't
+# pull in gensim or pandas just to create them.
+INDEX_STATEMENTS = [
+    "CREATE INDEX movie_title_idx IF NOT EXISTS FOR (m:Movie) ON (m.title)",
+    "CREATE CONSTRAINT IF NOT EXISTS FOR (u:User) REQUIRE u.userId IS UNIQUE",
+]
+
+# Projection of a path's nodes and relationships onto only what the figures
+# use, so Bolt doesn't ship every node property
+PATH_PROJECTION = (
+    "[n IN nodes(path) | {id: id(n), labels: labels(n), title: n.title, name: n.name}] AS pathNodes, "
+    "[r IN relationships(path) | [id(startNode(r)), id(endNode(r)), type(r)]] AS pathRels"
+)
+
+# Shortest path between two movies through shared actors, directors or genres,
+# returning its nodes and relationships.
+# Path length bounds can't be query parameters, so max_hops is formatted in
+# (together with PATH_PROJECTION).
+PATH_QUERY = """
+MATCH (m1:Movie {{title: $source}}), (m2:Movie {{title: $target}})
+WHERE m1 <> m2
+MATCH path = shortestPath((m1)-[:ACTED_IN|DIRECTED|HAS_GENRE*1..{max_hops}]-(m2))
+RETURN {projection}
+LIMIT 1
+"""
+
+# Number of (source, target, max_hops) paths kept in memory per visualizer
+PATH_CACHE_SIZE = 256
+
+# Embedding key prefix -> (node type, short label prefix) for the embedding plot
+NODE_KEY_PREFIXES = {
+    'movie': ('Movie', 'M:'),
+    'actor': ('Actor', 'A:'),
+    'director': ('Director', 'D:'),
+    'genre': ('Genre', 'G:'),
+}
+
+# Figures with more points than this are drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = 200
+
+
+def _path_tuples(nodes, rels):
+    """
+    Convert projected path nodes and relationships (see PATH_PROJECTION) into
+    plain, cacheable tuples.
+
+    Args:
+        nodes: {'id', 'labels', 'title', 'name'} maps along the path
+        rels: [start_id, end_id, type] lists along the path
+
+    Returns:
+        tuple: ([(node_id, labels, properties), ...], [(start_id, end_id, type), ...])
+    """
+    return (
+        [
+            (
+                node['id'],
+                tuple(node['labels']),
+                {key: node[key] for key in ('title', 'name') if node[key] is not None},
+            )
+            for node in nodes
+        ],
+        [tuple(rel) for rel in rels],
+    )
 
 
 class GraphVisualizer:
@@ -38,11 +105,20 @@ class GraphVisualizer:
         user = os.getenv('NEO4J_USER')
         password = os.getenv('NEO4J_PASSWORD')
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.db_name = os.getenv('NEO4J_DATABASE', 'neo4j')
+        self._ensure_indexes()
+
+        # Streamlit reruns ask for the same paths again and again, so path
+        # queries are memoized per instance, keyed by (source, target, max_hops)
+        self._fetch_path = lru_cache(maxsize=PATH_CACHE_SIZE)(self._fetch_path_raw)
 
         # Load Node2Vec model if available
         model_path = 'models/node2vec.model'
         self.wv = None
+        self._key_info = None
         if os.path.exists(model_path):
+            from gensim.models import KeyedVectors
+
             self.wv = KeyedVectors.load(model_path)
             print(f"Loaded Node2Vec model with {len(self.wv)} embeddings")
 
@@ -50,6 +126,39 @@ class GraphVisualizer:
         """Close Neo4j connection."""
         self.driver.close()
 
+    def _ensure_indexes(self):
+        """Create the lookup indexes if they don't exist yet; failures are not fatal."""
+        with self.driver.session(database=self.db_name) as session:
+            for statement in INDEX_STATEMENTS:
+                try:
+                    session.run(statement).consume()
+                except Exception as e:
+                    print(f"Could not create index ({e}); continuing without it")
+
+    def _read(self, query, parameters):
+        """
+        Run a read-only query in a managed read transaction.
+
+        Sessions aren't thread-safe and the visualizer is shared between
+        Streamlit sessions, so each call opens its own short-lived session from
+        the driver's warm connection pool. execute_read retries transient
+        failures. Results here are small and bounded, so every record is
+        pulled in one batch.
+
+        Args:
+            query: Parameterized Cypher query
+            parameters: Query parameters
+
+        Returns:
+            list: Result records
+        """
+        with self.driver.session(
+            database=self.db_name,
+            default_access_mode=READ_ACCESS,
+            fetch_size=-1
+        ) as session:
+            return session.execute_read(lambda tx: list(tx.run(query, parameters)))
+
     def get_recommendation_path(self, source_movie_title, target_movie_title):
         """
         Get the path between source and recommended movie.
@@ -59,74 +168,72 @@ class GraphVisualizer:
             target_movie_title: Title of recommended movie
 
         Returns:
-            NetworkX graph of the path
+            tuple: (nodes, edges), where nodes maps each readable label to its
+            attributes and edges is a list of (source, target, attributes)
         """
-        with self.driver.session() as session:
-            query = """
-            MATCH path = (m1:Movie {title: $source})-[*1..3]-(m2:Movie {title: $target})
-            RETURN path
-            LIMIT 1
-            """
-            result = session.run(query, {
-                'source': source_movie_title,
-                'target': target_movie_title
-            })
-
-            record = result.single()
-            if not record:
-                return None
-
-            # Convert Neo4j path to NetworkX graph
-            path = record['path']
-            G = nx.Graph()
-
-            for node in path.nodes:
-                labels = list(node.labels)
-                node_data = dict(node)
-                node_id = node.id
-
-                # Create a readable label
-                if 'Movie' in labels:
-                    label = node_data.get('title', f'Movie {node_id}')
-                    node_type = 'Movie'
-                elif 'Actor' in labels:
-                    label = node_data.get('name', f'Actor {node_id}')
-                    node_type = 'Actor'
-                elif 'Director' in labels:
-                    label = node_data.get('name', f'Director {node_id}')
-                    node_type = 'Director'
-                elif 'Genre' in labels:
-                    label = node_data.get('name', f'Genre {node_id}')
-                    node_type = 'Genre'
-                else:
-                    label = f'Node {node_id}'
-                    node_type = 'Unknown'
-
-                G.add_node(label, type=node_type, **node_data)
-
-            for rel in path.relationships:
-                start_node = path.nodes[0]
-                end_node = path.nodes[-1]
-
-                # Find node labels
-                start_label = self._get_node_label(rel.start_node)
-                end_label = self._get_node_label(rel.end_node)
-
-                G.add_edge(start_label, end_label, type=rel.type)
-
-            return G
-
-    def _get_node_label(self, node):
-        """Get readable label for a node."""
-        labels = list(node.labels)
-        node_data = dict(node)
-
-        if 'Movie' in labels:
-            return node_data.get('title', f'Movie {node.id}')
-        elif 'Actor' in labels or 'Director' in labels or 'Genre' in labels:
-            return node_data.get('name', f'Node {node.id}')
-        else:
-            return f'Node {node.id}'
+        path = self._fetch_path(source_movie_title, target_movie_title, max_hops=3)
+        if not path:
+            return None
+
+        # Convert Neo4j path to labelled nodes and edges
+        path_nodes, rels = path
+        nodes = {}
+
+        # Readable label of each node on the path, so edges can look up
+        # their endpoints instead of rebuilding labels
+        id2label = {}
+
+        for node_id, labels, node_data in path_nodes:
+            # Create a readable label
+            if 'Movie' in labels:
+                label = node_data.get('title', f'Movie {node_id}')
+                node_type = 'Movie'
+            elif 'Actor' in labels:
+                label = node_data.get('name', f'Actor {node_id}')
+                node_type = 'Actor'
+            elif 'Director' in labels:
+                label = node_data.get('name', f'Director {node_id}')
+                node_type = 'Director'
+            elif 'Genre' in labels:
+                label = node_data.get('name', f'Genre {node_id}')
+                node_type = 'Genre'
+            else:
+                label = f'Node {node_id}'
+                node_type = 'Unknown'
+
+            nodes[label] = {**node_data, 'type': node_type}
+            id2label[node_id] = label
+
+        edges = [
+            (id2label[start_id], id2label[end_id], {'type': rel_type})
+            for start_id, end_id, rel_type in rels
+        ]
+
+        return nodes, edges
+
+    def _fetch_path_raw(self, source_movie, target_movie, max_hops):
+        """
+        Fetch the shortest path between two movies in one query.
+
+        Called through the memoized self._fetch_path.
+
+        Args:
+            source_movie: Source movie title
+            target_movie: Target movie title
+            max_hops: Maximum number of relationships on the path
+
+        Returns:
+            tuple: (nodes, relationships) along the path as plain tuples
+                (see _path_tuples), or None if there is none
+        """
+        records = self._read(PATH_QUERY.format(max_hops=int(max_hops), projection=PATH_PROJECTION), {
+            'source': source_movie,
+            'target': target_movie
+        })
+
+        if not records:
+            return None
+        return _path_tuples(records[0]['pathNodes'], records[0]['pathRels'])
 
     def visualize_recommendation_path(self, source_movie, target_movie):
         """
@@ -139,126 +246,159 @@ class GraphVisualizer:
         Returns:
             Plotly figure
         """
-        with self.driver.session() as session:
-            # Get the path with all node details
-            query = """
-            MATCH path = (m1:Movie {title: $source})-[*1..2]-(m2:Movie {title: $target})
-            WITH path, nodes(path) as pathNodes, relationships(path) as pathRels
-            RETURN pathNodes, pathRels
+        path = self._fetch_path(source_movie, target_movie, max_hops=2)
+        if not path:
+            return None
+
+        return self._build_path_figure(source_movie, target_movie, *path)
+
+    def visualize_recommendation_paths_batch(self, source_movie, target_movies):
+        """
+        Create path visualizations from one source movie to many targets.
+
+        All paths are fetched with a single Cypher query (one Bolt round-trip)
+        instead of one query per target.
+
+        Args:
+            source_movie: Source movie title
+            target_movies: List of recommended movie titles
+
+        Returns:
+            dict: Target title -> Plotly figure (targets without a path are omitted)
+        """
+        query = """
+        MATCH (m1:Movie {title: $source})
+        UNWIND $targets AS target
+        CALL {
+            WITH m1, target
+            MATCH (m2:Movie {title: target})
+            WHERE m2 <> m1
+            MATCH path = shortestPath((m1)-[:ACTED_IN|DIRECTED|HAS_GENRE*1..2]-(m2))
+            RETURN path
             LIMIT 1
-            """
-            result = session.run(query, {
-                'source': source_movie,
-                'target': target_movie
-            })
-
-            record = result.single()
-            if not record:
-                return None
-
-            nodes = record['pathNodes']
-            rels = record['pathRels']
-
-            # Build NetworkX graph for layout
-            G = nx.Graph()
-            node_info = {}
-
-            for i, node in enumerate(nodes):
-                labels = list(node.labels)
-                node_type = labels[0] if labels else 'Unknown'
-
-                if node_type == 'Movie':
-                    label = node.get('title', 'Unknown Movie')
-                else:
-                    label = node.get('name', 'Unknown')
-
-                G.add_node(i)
-                node_info[i] = {
-                    'label': label,
-                    'type': node_type
-                }
-
-            for rel in rels:
-                # Find indices of start and end nodes
-                start_idx = next(i for i, n in enumerate(nodes) if n.id == rel.start_node.id)
-                end_idx = next(i for i, n in enumerate(nodes) if n.id == rel.end_node.id)
-                G.add_edge(start_idx, end_idx, type=rel.type)
-
-            # Use spring layout for positioning
-            pos = nx.spring_layout(G, k=2, iterations=50)
-
-            # Create edges
-            edge_trace = []
-            for edge in G.edges():
-                x0, y0 = pos[edge[0]]
-                x1, y1 = pos[edge[1]]
-
-                edge_trace.append(go.Scatter(
-                    x=[x0, x1, None],
-                    y=[y0, y1, None],
-                    mode='lines',
-                    line=dict(width=3, color='#888'),
-                    hoverinfo='none',
-                    showlegend=False
-                ))
-
-            # Create nodes
-            node_x = []
-            node_y = []
-            node_text = []
-            node_color = []
-            node_size = []
-
-            color_map = {
-                'Movie': '#FF4B4B',
-                'Actor': '#4B88FF',
-                'Director': '#FFB84B',
-                'Genre': '#4BFF88'
-            }
+        }
+        RETURN target, """ + PATH_PROJECTION
+        records = self._read(query, {
+            'source': source_movie,
+            'targets': list(target_movies)
+        })
+
+        return {
+            record['target']: self._build_path_figure(
+                source_movie, record['target'], *_path_tuples(record['pathNodes'], record['pathRels'])
+            )
+            for record in records
+        }
+
+    def _build_path_figure(self, source_movie, target_movie, nodes, rels):
+        """
+        Lay out a path and render it as a Plotly figure.
+
+        Args:
+            source_movie: Source movie title (used in the figure title)
+            target_movie: Recommended movie title (used in the figure title)
+            nodes: (node_id, labels, properties) tuples along the path
+            rels: (start_id, end_id, type) tuples along the path
+
+        Returns:
+            Plotly figure
+        """
+        import plotly.graph_objects as go
 
-            for node in G.nodes():
-                x, y = pos[node]
-                node_x.append(x)
-                node_y.append(y)
-
-                info = node_info[node]
-                node_text.append(f"{info['type']}: {info['label']}")
-                node_color.append(color_map.get(info['type'], '#999999'))
-                node_size.append(40 if info['type'] == 'Movie' else 25)
-
-            node_trace = go.Scatter(
-                x=node_x,
-                y=node_y,
-                mode='markers+text',
-                hoverinfo='text',
-                text=[node_info[i]['label'] for i in G.nodes()],
-                textposition="top center",
-                hovertext=node_text,
-                marker=dict(
-                    size=node_size,
-                    color=node_color,
-                    line=dict(width=2, color='white')
-                )
+        node_types = []
+        node_labels = []
+
+        for _, labels, props in nodes:
+            node_type = labels[0] if labels else 'Unknown'
+
+            if node_type == 'Movie':
+                label = props.get('title', 'Unknown Movie')
+            else:
+                label = props.get('name', 'Unknown')
+
+            node_types.append(node_type)
+            node_labels.append(label)
+
+        node_types = np.array(node_types, dtype=object)
+        node_labels = np.array(node_labels, dtype=object)
+
+        # nodes(path) lists the nodes in path order, so a path is laid out
+        # directly along a line, alternating slightly up and down to keep long
+        # labels apart; no graph structure or force layout is needed
+        order = np.arange(len(nodes))
+        node_x = order.astype(float)
+        node_y = 0.15 * (order % 2)
+
+        Scatter = go.Scattergl if len(nodes) > WEBGL_THRESHOLD else go.Scatter
+
+        # Index of each node by Neo4j ID, so edge endpoints are found in O(1)
+        idx = {node_id: i for i, (node_id, _, _) in enumerate(nodes)}
+        start = np.fromiter((idx[start_id] for start_id, _, _ in rels), dtype=np.int64, count=len(rels))
+        end = np.fromiter((idx[end_id] for _, end_id, _ in rels), dtype=np.int64, count=len(rels))
+
+        # Create edges as a single trace; a NaN after each edge breaks the line
+        gap = np.full(len(rels), np.nan)
+        edge_x = np.column_stack([node_x[start], node_x[end], gap]).ravel()
+        edge_y = np.column_stack([node_y[start], node_y[end], gap]).ravel()
+
+        edge_trace = Scatter(
+            x=edge_x,
+            y=edge_y,
+            mode='lines',
+            line=dict(width=3, color='#888'),
+            hoverinfo='none',
+            showlegend=False
+        )
+
+        # Create nodes
+        color_map = {
+            'Movie': '#FF4B4B',
+            'Actor': '#4B88FF',
+            'Director': '#FFB84B',
+            'Genre': '#4BFF88'
+        }
+
+        node_text = node_types + ': ' + node_labels
+        node_color = np.select(
+            [node_types == node_type for node_type in color_map],
+            list(color_map.values()),
+            default='#999999'
+        )
+        node_size = np.where(node_types == 'Movie', 40, 25)
+
+        node_trace = Scatter(
+            x=node_x,
+            y=node_y,
+            mode='markers+text',
+            hoverinfo='text',
+            text=node_labels,
+            textposition="top center",
+            hovertext=node_text,
+            marker=dict(
+                size=node_size,
+                color=node_color,
+                line=dict(width=2, color='white')
             )
+        )
 
-            # Create figure
-            fig = go.Figure(
-                data=edge_trace + [node_trace],
-                layout=go.Layout(
-                    title=dict(
-                        text=f"Recommendation Path: {source_movie} → {target_movie}",
-                        font=dict(size=16)
-                    ),
-                    showlegend=False,
-                    hovermode='closest',
-                    margin=dict(b=0, l=0, r=0, t=40),
-                    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                    plot_bgcolor='white'
-                )
+        # Create figure
+        fig = go.Figure(
+            data=[edge_trace, node_trace],
+            layout=go.Layout(
+                title=dict(
+                    text=f"Recommendation Path: {source_movie} → {target_movie}",
+                    font=dict(size=16)
+                ),
+                showlegend=False,
+                hovermode='closest',
+                margin=dict(b=0, l=0, r=0, t=40),
+                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                plot_bgcolor='white'
             )
+        )
 
-            return fig
+        return fig
 
     def get_user_graph(self, user_id, limit=20):
         """
@@ -269,38 +409,63 @@ class GraphVisualizer:
             limit: Maximum number of movies to include
 
         Returns:
-            NetworkX graph
+            tuple: (nodes, edges), where nodes maps each name to its attributes
+            and edges is a list of (movie title, connection name) pairs
         """
-        with self.driver.session() as session:
-            query = """
-            MATCH (u:User {userId: $userId})-[r:RATED]->(m:Movie)
-            WITH m, r
-            ORDER BY r.rating DESC, r.timestamp DESC
-            LIMIT $limit
-            MATCH (m)-[rel]-(connected)
-            WHERE connected:Actor OR connected:Director OR connected:Genre
-            RETURN m, rel, connected, r.rating as rating
-            """
-            result = session.run(query, {'userId': user_id, 'limit': limit})
+        query = """
+        MATCH (u:User {userId: $userId})-[r:RATED]->(m:Movie)
+        WITH m, r
+        ORDER BY r.rating DESC, r.timestamp DESC
+        LIMIT $limit
+        MATCH (m)-[rel]-(connected)
+        WHERE connected:Actor OR connected:Director OR connected:Genre
+        WITH m, r.rating AS rating, collect({
+            name: coalesce(connected.name, connected.title, 'Unknown'),
+            type: coalesce(head(labels(connected)), 'Unknown')
+        }) AS connections
+        RETURN coalesce(m.title, 'Unknown') AS title, rating, connections
+        """
+        # One record per movie, with its connections aggregated server-side
+        records = self._read(query, {'userId': user_id, 'limit': limit})
+
+        nodes = {}
+        # Keyed by endpoint pair so a connection reached through several
+        # relationships is only counted once
+        edges = {}
+
+        for record in records:
+            movie_title = record['title']
+            nodes[movie_title] = {'type': 'Movie', 'rating': record['rating']}
 
-            G = nx.Graph()
+            for connection in record['connections']:
+                nodes.setdefault(connection['name'], {'type': connection['type']})
+                edges[movie_title, connection['name']] = None
 
-            for record in result:
-                movie = record['m']
-                connected = record['connected']
-                rating = record['rating']
+        return nodes, list(edges)
 
-                movie_title = movie.get('title', 'Unknown')
-                G.add_node(movie_title, type='Movie', rating=rating)
+    def _embedding_key_info(self):
+        """
+        Get the node type and short label of every embedding key.
 
-                conn_labels = list(connected.labels)
-                conn_type = conn_labels[0] if conn_labels else 'Unknown'
-                conn_name = connected.get('name', connected.get('title', 'Unknown'))
+        The vocabulary is fixed once the model is loaded, so the key prefixes
+        are parsed on first use only, with vectorized string ops; keys with an
+        unknown prefix keep their full ID as the label.
 
-                G.add_node(conn_name, type=conn_type)
-                G.add_edge(movie_title, conn_name)
+        Returns:
+            tuple: (types, labels) object arrays aligned with wv.index_to_key
+        """
+        if self._key_info is None:
+            import pandas as pd
 
-            return G
+            key_series = pd.Series(self.wv.index_to_key, dtype=object)
+            parts = key_series.str.partition('_')
+            prefix = parts[0]
+            node_types = prefix.map({p: t for p, (t, _) in NODE_KEY_PREFIXES.items()}).fillna('Other')
+            short_prefix = prefix.map({p: short for p, (_, short) in NODE_KEY_PREFIXES.items()})
+            node_labels = (short_prefix + parts[2]).fillna(key_series)
+            self._key_info = (node_types.to_numpy(), node_labels.to_numpy())
+
+        return self._key_info
 
     def visualize_embeddings_2d(self, node_ids=None, max_nodes=500):
         """
@@ -316,44 +481,37 @@ class GraphVisualizer:
         if not self.wv:
             raise ValueError("Node2Vec model not loaded")
 
+        import pandas as pd
+        import plotly.express as px
+        from sklearn.decomposition import PCA
+
         # Get embeddings
+        # Filter against the vocabulary dict directly rather than through
+        # KeyedVectors.__contains__ for every key
+        vocab = self.wv.key_to_index
         if node_ids:
-            keys = [k for k in node_ids if k in self.wv]
+            keys = [k for k in node_ids if k in vocab]
         else:
             keys = list(self.wv.index_to_key)[:max_nodes]
 
-        embeddings = np.array([self.wv[k] for k in keys])
+        # Gather all rows from the embedding matrix in one indexing operation
+        idxs = np.fromiter((self.wv.key_to_index[k] for k in keys), dtype=np.int64, count=len(keys))
+        embeddings = self.wv.vectors[idxs]
 
-        # Reduce to 2D using PCA
-        pca = PCA(n_components=2)
+        # Reduce to 2D using PCA; the randomized solver only computes the two
+        # components needed instead of a full SVD of the embedding matrix
+        pca = PCA(n_components=2, svd_solver='randomized', random_state=0)
         coords_2d = pca.fit_transform(embeddings)
 
-        # Parse node types
-        node_types = []
-        node_labels = []
-        for key in keys:
-            if key.startswith('movie_'):
-                node_types.append('Movie')
-                node_labels.append(key.replace('movie_', 'M:'))
-            elif key.startswith('actor_'):
-                node_types.append('Actor')
-                node_labels.append(key.replace('actor_', 'A:'))
-            elif key.startswith('director_'):
-                node_types.append('Director')
-                node_labels.append(key.replace('director_', 'D:'))
-            elif key.startswith('genre_'):
-                node_types.append('Genre')
-                node_labels.append(key.replace('genre_', 'G:'))
-            else:
-                node_types.append('Other')
-                node_labels.append(key)
+        # Node types and labels, parsed once per model
+        types, labels = self._embedding_key_info()
 
         # Create DataFrame
         df = pd.DataFrame({
             'x': coords_2d[:, 0],
             'y': coords_2d[:, 1],
-            'type': node_types,
-            'label': node_labels,
+            'type': types[idxs],
+            'label': labels[idxs],
             'full_id': keys
         })
 
@@ -365,6 +523,7 @@ class GraphVisualizer:
             color='type',
             hover_data=['full_id'],
             title='Node2Vec Embeddings in 2D Space (PCA)',
+            render_mode='webgl' if len(df) > WEBGL_THRESHOLD else 'svg',
             color_discrete_map={
                 'Movie': '#FF4B4B',
                 'Actor': '#4B88FF',
@@ -414,8 +573,8 @@ if __name__ == "__main__":
 
         elif args.user_id:
             print(f"Getting graph for user {args.user_id}")
-            G = viz.get_user_graph(args.user_id)
-            print(f"Graph has {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
+            nodes, edges = viz.get_user_graph(args.user_id)
+            print(f"Graph has {len(nodes)} nodes and {len(edges)} edges")
 
         else:
             print("Please provide --source and --target, --user-id, or --embeddings")